@@ -16,19 +16,21 @@ log_dir = os.path.expanduser("~/Library/Logs/ustwo_tools")
 os.makedirs(log_dir, exist_ok=True)
 log_file = os.path.join(log_dir, "ustwo_tools.log")
 
-logging.basicConfig(
-    filename=log_file,
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Skip reconfiguring if logging has already been set up
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        filename=log_file,
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 
 def main():
     """Main entry point for the application"""
     try:
         # Log startup information
         logging.info("=== ustwo IT Tools starting ===")
-        logging.info(f"Python version: {sys.version}")
-        logging.info(f"Current directory: {os.getcwd()}")
+        logging.info("Python version: %s", sys.version)
+        logging.info("Current directory: %s", os.getcwd())
         
         # Add app resources directory to path
         if getattr(sys, 'frozen', False):
@@ -37,13 +39,13 @@ def main():
             resources_path = os.path.join(app_path, 'Resources')
             if resources_path not in sys.path:
                 sys.path.insert(0, resources_path)
-            logging.info(f"Running as bundled app, added {resources_path} to path")
+            logging.info("Running as bundled app, added %s to path", resources_path)
         else:
             # Running as script
             app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             if app_dir not in sys.path:
                 sys.path.insert(0, app_dir)
-            logging.info(f"Running as script, added {app_dir} to path")
+            logging.info("Running as script, added %s to path", app_dir)
         
         # Import main app
         logging.info("Importing main application...")
@@ -54,7 +56,7 @@ def main():
         app_main()
         
     except Exception as e:
-        logging.error(f"Error in launcher: {str(e)}", exc_info=True)
+        logging.error("Error in launcher: %s", e, exc_info=True)
         
         # Show error dialog if possible
         try:
@@ -68,7 +70,7 @@ def main():
             error_box.setDetailedText(str(e))
             error_box.exec_()
         except Exception as dialog_error:
-            logging.error(f"Failed to show error dialog: {str(dialog_error)}", exc_info=True)
+            logging.error("Failed to show error dialog: %s", dialog_error, exc_info=True)
             print(f"Error starting application. See log file: {log_file}")
     
     logging.info("=== ustwo IT Tools exiting ===")
@@ -9,27 +9,17 @@ import shutil
 import subprocess
 from pathlib import Path
 
-def run_command(command):
-    """Run a command and print output"""
-    print(f"Running: {command}")
-    subprocess.run(command, shell=True, check=True)
+# Values substituted into SPEC_TEMPLATE
+SPEC_CONFIG = {
+    "app_name": "ustwo IT Tools.app",
+    "display_name": "ustwo IT Tools",
+    "bundle_id": "com.ustwo.it-tools",
+    "version": "1.0.0",
+    "icon": "assets/brandingimage.icns",
+}
 
-def main():
-    print("Setting up PyInstaller for ustwo IT Tools...")
-    
-    # Clean previous builds
-    if os.path.exists("build"):
-        shutil.rmtree("build")
-    if os.path.exists("dist"):
-        shutil.rmtree("dist")
-    
-    # Install PyInstaller if needed
-    run_command("pip install 'PyInstaller<5.0'")
-    
-    # Create a spec file with proper configuration
-    spec_file = "ustwo_tools.spec"
-    with open(spec_file, "w") as f:
-        f.write("""# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec; literal braces are doubled for str.format
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
@@ -52,9 +42,25 @@ a = Analysis(
         'config',
     ],
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
-    excludes=['pkg_resources.py2_warn', 'pkg_resources.tests'],
+    excludes=[
+        'tkinter',
+        'matplotlib',
+        'numpy',
+        'scipy',
+        'pandas',
+        'IPython',
+        'jedi',
+        'test',
+        'unittest',
+        'pydoc_data',
+        'sqlite3',
+        'xmlrpc',
+        'lib2to3',
+        'pkg_resources.py2_warn',
+        'pkg_resources.tests',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -79,7 +85,7 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    icon='assets/brandingimage.icns',
+    icon='{icon}',
 )
 
 coll = COLLECT(
@@ -95,26 +101,48 @@ coll = COLLECT(
 
 app = BUNDLE(
     coll,
-    name='ustwo IT Tools.app',
-    icon='assets/brandingimage.icns',
-    bundle_identifier='com.ustwo.it-tools',
-    info_plist={
-        'CFBundleShortVersionString': '1.0.0',
-        'CFBundleVersion': '1.0.0',
+    name='{app_name}',
+    icon='{icon}',
+    bundle_identifier='{bundle_id}',
+    info_plist={{
+        'CFBundleShortVersionString': '{version}',
+        'CFBundleVersion': '{version}',
         'NSHighResolutionCapable': True,
         'NSPrincipalClass': 'NSApplication',
         'NSAppleScriptEnabled': False,
-        'CFBundleDisplayName': 'ustwo IT Tools',
-        'CFBundleName': 'ustwo IT Tools',
+        'CFBundleDisplayName': '{display_name}',
+        'CFBundleName': '{display_name}',
         'CFBundleExecutable': 'ustwo_tools',
-        'LSEnvironment': {
+        'LSEnvironment': {{
             'PYTHONDONTWRITEBYTECODE': '1',
             'PYTHONNOUSERSITE': '1',
-        },
+        }},
         'LSMinimumSystemVersion': '10.13.0',
-    },
+    }},
 )
-""")
+"""
+
+def run_command(argv, env=None):
+    """Run a command (a list of arguments) and print it first"""
+    print(f"Running: {' '.join(argv)}")
+    subprocess.run(argv, env=env, check=True)
+
+def main():
+    print("Setting up PyInstaller for ustwo IT Tools...")
+    
+    # Clean previous builds
+    if os.path.exists("build"):
+        shutil.rmtree("build")
+    if os.path.exists("dist"):
+        shutil.rmtree("dist")
+    
+    # Install PyInstaller if needed
+    run_command([sys.executable, "-m", "pip", "install", "PyInstaller<5.0"])
+    
+    # Create a spec file with proper configuration
+    spec_file = "ustwo_tools.spec"
+    with open(spec_file, "w") as f:
+        f.write(SPEC_TEMPLATE.format(**SPEC_CONFIG))
     
     # Call PyInstaller with the spec file and extra options for Apple Silicon Macs
     print("Building the app with PyInstaller...")
@@ -123,7 +151,7 @@ app = BUNDLE(
     env_vars = {
         "PYTHONDONTWRITEBYTECODE": "1",
         "PYTHONNOUSERSITE": "1",
-        "PYTHONOPTIMIZE": "1",
+        "PYTHONOPTIMIZE": "2",  # Also strips docstrings from the bundled .pyc files
     }
     
     # Create environment with necessary variables
@@ -131,10 +159,9 @@ app = BUNDLE(
     build_env.update(env_vars)
     
     # Run PyInstaller with the spec file
-    subprocess.run(
+    run_command(
         ["python3", "-m", "PyInstaller", "--clean", "--noconfirm", spec_file],
-        env=build_env,
-        check=True
+        env=build_env
     )
     
     print("\nBuild complete! You can find the app at:")
@@ -1,5 +1,5 @@
 #!/bin/bash
 echo "=== Starting build process for ustwo IT Tools with debug support ==="
 echo "Cleaning up previous builds..."; rm -rf build dist
-echo "Building app with py2app..."; python3 setup_py2app.py py2app
+echo "Building app with py2app..."; USTWO_DEBUG_BUILD=1 python3 setup.py py2app
 echo "=== Build process complete ==="
@@ -5,10 +5,49 @@ This creates a macOS app bundle manually without PyInstaller or py2app
 """
 import os
 import sys
+import plistlib
 import shutil
-import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Python sources bundled into Contents/Resources
+SOURCE_FILES = [
+    "ustwo_tools.py",
+    "Create_Group.py",
+    "Shared_Drive.py",
+    "Offboarding.py",
+    "config.py",
+]
+
+# Info.plist contents, written as a binary plist
+INFO_PLIST = {
+    "CFBundleDevelopmentRegion": "English",
+    "CFBundleDisplayName": "ustwo IT Tools",
+    "CFBundleExecutable": "ustwo_it_tools",
+    "CFBundleIconFile": "icon.icns",
+    "CFBundleIdentifier": "com.ustwo.it-tools",
+    "CFBundleInfoDictionaryVersion": "6.0",
+    "CFBundleName": "ustwo IT Tools",
+    "CFBundlePackageType": "APPL",
+    "CFBundleShortVersionString": "1.0",
+    "CFBundleVersion": "1.0",
+    "NSHighResolutionCapable": True,
+    "NSPrincipalClass": "NSApplication",
+    "NSAppleScriptEnabled": False,
+}
+
+def copy_files(pairs):
+    """Copy (src, dst) pairs in parallel; the copies are I/O bound"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda pair: shutil.copyfile(*pair), pairs))
+
+def set_permissions(app_path, executables):
+    """Make every directory in the bundle and the given executables 755"""
+    for dirpath, dirnames, filenames in os.walk(app_path):
+        os.chmod(dirpath, 0o755)
+    for path in executables:
+        os.chmod(path, 0o755)
+
 def main():
     print("Building ustwo IT Tools app bundle directly...")
     
@@ -39,56 +78,16 @@ cd "$DIR/../Resources"
 /usr/bin/env python3 "$DIR/../Resources/ustwo_tools.py"
 """)
     
-    # Make launcher executable
-    os.chmod(launcher_path, 0o755)
-    
     # Create Info.plist
-    plist_path = contents_path / "Info.plist"
-    with open(plist_path, "w") as f:
-        f.write("""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>CFBundleDevelopmentRegion</key>
-    <string>English</string>
-    <key>CFBundleDisplayName</key>
-    <string>ustwo IT Tools</string>
-    <key>CFBundleExecutable</key>
-    <string>ustwo_it_tools</string>
-    <key>CFBundleIconFile</key>
-    <string>icon.icns</string>
-    <key>CFBundleIdentifier</key>
-    <string>com.ustwo.it-tools</string>
-    <key>CFBundleInfoDictionaryVersion</key>
-    <string>6.0</string>
-    <key>CFBundleName</key>
-    <string>ustwo IT Tools</string>
-    <key>CFBundlePackageType</key>
-    <string>APPL</string>
-    <key>CFBundleShortVersionString</key>
-    <string>1.0</string>
-    <key>CFBundleVersion</key>
-    <string>1.0</string>
-    <key>NSHighResolutionCapable</key>
-    <true/>
-    <key>NSPrincipalClass</key>
-    <string>NSApplication</string>
-    <key>NSAppleScriptEnabled</key>
-    <false/>
-</dict>
-</plist>
-""")
+    with open(contents_path / "Info.plist", "wb") as f:
+        plistlib.dump(INFO_PLIST, f, fmt=plistlib.FMT_BINARY)
     
     # Create PkgInfo
     with open(contents_path / "PkgInfo", "w") as f:
         f.write("APPL????")
     
-    # Copy the Python files
-    shutil.copy("ustwo_tools.py", resources_path)
-    shutil.copy("Create_Group.py", resources_path)
-    shutil.copy("Shared_Drive.py", resources_path)
-    shutil.copy("Offboarding.py", resources_path)
-    shutil.copy("config.py", resources_path)
+    # Python files are copied together with the icon further down
+    copy_pairs = [(name, resources_path / name) for name in SOURCE_FILES]
     
     # Create config directory in Resources
     config_resources_path = resources_path / "config"
@@ -107,21 +106,20 @@ cd "$DIR/../Resources"
     
     # Copy assets
     assets_resources_path = resources_path / "assets"
-    assets_resources_path.mkdir(exist_ok=True)
     
     if os.path.exists("assets"):
-        for item in os.listdir("assets"):
-            src_path = os.path.join("assets", item)
-            dst_path = os.path.join(assets_resources_path, item)
-            if os.path.isfile(src_path):
-                shutil.copy(src_path, dst_path)
+        shutil.copytree("assets", assets_resources_path, dirs_exist_ok=True)
+    else:
+        assets_resources_path.mkdir(exist_ok=True)
     
     # Copy icon
     if os.path.exists("assets/brandingimage.icns"):
-        shutil.copy("assets/brandingimage.icns", resources_path / "icon.icns")
+        copy_pairs.append(("assets/brandingimage.icns", resources_path / "icon.icns"))
+    
+    copy_files(copy_pairs)
     
-    # Set proper permissions
-    subprocess.run(["chmod", "-R", "755", str(app_path)])
+    # Set proper permissions; only the launcher needs to be executable
+    set_permissions(app_path, [launcher_path])
     
     print(f"\nApp bundle created successfully at: {app_path}")
     print("To run the app:")
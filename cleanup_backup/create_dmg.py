@@ -5,14 +5,15 @@ This script creates a macOS DMG installer for the app bundle
 """
 import os
 import sys
+import shutil
 import subprocess
 from pathlib import Path
 
-def run_command(command):
-    """Run a shell command and return its output"""
-    process = subprocess.run(command, shell=True, capture_output=True, text=True)
+def run_command(argv):
+    """Run a command (a list of arguments); stderr is only shown on failure"""
+    process = subprocess.run(argv, stderr=subprocess.PIPE, text=True, check=False)
     if process.returncode != 0:
-        print(f"Error running command: {command}")
+        print(f"Error running command: {' '.join(argv)}")
         print(f"Error: {process.stderr}")
         return False
     return True
@@ -27,10 +28,9 @@ def main():
         return
     
     # Check if create-dmg is installed
-    result = subprocess.run("which create-dmg", shell=True, capture_output=True, text=True)
-    if result.returncode != 0:
+    if shutil.which("create-dmg") is None:
         print("create-dmg not found. Installing...")
-        if not run_command("brew install create-dmg"):
+        if subprocess.run(["brew", "install", "create-dmg"], check=False).returncode != 0:
             print("Failed to install create-dmg. Please install it manually with 'brew install create-dmg'")
             return
     
@@ -40,34 +40,26 @@ def main():
         os.remove(dmg_path)
     
     print("Creating DMG...")
-    dmg_command = f"""
-    create-dmg \\
-      --volname "ustwo IT Tools Installer" \\
-      --background "assets/dmg_background.png" \\
-      --window-pos 200 120 \\
-      --window-size 800 400 \\
-      --icon-size 100 \\
-      --icon "ustwo IT Tools.app" 200 190 \\
-      --app-drop-link 600 185 \\
-      --skip-jenkins \\
-      "dist/ustwo_IT_Tools.dmg" \\
-      "dist/ustwo IT Tools.app"
-    """
+    dmg_command = [
+        "create-dmg",
+        "--volname", "ustwo IT Tools Installer",
+        "--window-pos", "200", "120",
+        "--window-size", "800", "400",
+        "--icon-size", "100",
+        "--icon", "ustwo IT Tools.app", "200", "190",
+    ]
     
-    # If background image doesn't exist, use a simpler command
-    if not Path("assets/dmg_background.png").exists():
-        dmg_command = f"""
-        create-dmg \\
-          --volname "ustwo IT Tools Installer" \\
-          --window-pos 200 120 \\
-          --window-size 800 400 \\
-          --icon-size 100 \\
-          --icon "ustwo IT Tools.app" 200 190 \\
-          --app-drop-link 600 190 \\
-          --skip-jenkins \\
-          "dist/ustwo_IT_Tools.dmg" \\
-          "dist/ustwo IT Tools.app"
-        """
+    # Only use a background image if there is one
+    if Path("assets/dmg_background.png").exists():
+        dmg_command += ["--background", "assets/dmg_background.png", "--app-drop-link", "600", "185"]
+    else:
+        dmg_command += ["--app-drop-link", "600", "190"]
+    
+    dmg_command += [
+        "--skip-jenkins",
+        "dist/ustwo_IT_Tools.dmg",
+        "dist/ustwo IT Tools.app",
+    ]
     
     if run_command(dmg_command):
         print(f"\nDMG created successfully at: dist/ustwo_IT_Tools.dmg")
@@ -1,4 +1,62 @@
+import glob
+import os
+import shutil
+
 from setuptools import setup
+# py2app is imported here, before setup() runs, so it has to be installed
+# beforehand (pip install -r requirements.txt); setup_requires cannot fetch it
+from py2app.build_app import py2app
+
+# The only Qt plugins a widgets app on macOS that shows an icns needs
+QT_PLUGINS = {
+    'platforms': {'libqcocoa.dylib'},
+    'imageformats': {'libqicns.dylib'},
+    'styles': {'libqmacstyle.dylib'},
+}
+
+
+class py2app_bytecode_only(py2app):
+    """
+    Build the app, then trim the packages listed in 'packages', which are
+    the only modules py2app copies into the bundle's lib folder as loose
+    directories; with 'compressed' on, everything else is already bytecode
+    in the zipped library:
+    - delete the .py sources that have compiled bytecode beside them, so
+      only bytecode ships. Bytecode in __pycache__ is not used without its
+      source, so those sources are kept.
+    - delete every Qt plugin not listed in QT_PLUGINS, since Qt's plugin
+      loader looks at each one at startup.
+    """
+    def run(self):
+        super().run()
+        lib_dirs = glob.glob(os.path.join(
+            self.dist_dir, '*.app', 'Contents', 'Resources', 'lib', 'python3*'))
+        for lib_dir in lib_dirs:
+            for package in self.packages:
+                self.trim_package(os.path.join(lib_dir, *package.split('.')))
+
+    def trim_package(self, package_dir):
+        for root, dirs, files in os.walk(package_dir):
+            if os.path.basename(root) == 'plugins' and 'PyQt5' in root:
+                self.trim_qt_plugins(root, dirs)
+                dirs.clear()
+                continue
+            for name in files:
+                if name.endswith('.py') and name + 'c' in files:
+                    os.remove(os.path.join(root, name))
+
+    @staticmethod
+    def trim_qt_plugins(plugins_dir, kinds):
+        for kind in kinds:
+            path = os.path.join(plugins_dir, kind)
+            keep = QT_PLUGINS.get(kind)
+            if keep is None:
+                shutil.rmtree(path)
+                continue
+            for name in os.listdir(path):
+                if name not in keep:
+                    os.remove(os.path.join(path, name))
+
 
 APP = ['ustwo_tools.py']
 DATA_FILES = [
@@ -7,28 +65,17 @@ DATA_FILES = [
 ]
 OPTIONS = {
     'argv_emulation': False,
-    'packages': [
-        'PyQt5',
-        'PyQt5.QtCore',
-        'PyQt5.QtGui',
-        'PyQt5.QtWidgets',
-        'PyQt5.sip',
-        'config',
-        'json',
-        'os',
-        'sys',
-        'subprocess',
-        'logging'
+    # Only third-party packages are listed; modulegraph finds the standard
+    # library and the tool modules from the imports in APP
+    'packages': ['PyQt5'],
+    # Standard library packages and Qt modules the app never imports
+    'excludes': [
+        'tkinter', 'test', 'unittest',
+        'pydoc_data', 'distutils', 'setuptools', 'pip',
+        'PyQt5.QtQml', 'PyQt5.QtWebEngineWidgets', 'PyQt5.QtMultimedia',
+        'PyQt5.QtSql', 'PyQt5.QtNetwork', 'PyQt5.QtPrintSupport'
     ],
-    'includes': [
-        'config',
-        'json',
-        'os',
-        'subprocess',
-        'sys',
-        'logging'
-    ],
-    'excludes': ['tkinter'],
+    'qt_plugins': ['platforms/libqcocoa', 'imageformats/libqicns', 'styles/libqmacstyle'],
     'iconfile': 'assets/brandingimage.icns',
     'plist': {
         'CFBundleName': 'ustwo IT Tools',
@@ -38,11 +85,15 @@ OPTIONS = {
         'CFBundleShortVersionString': '1.0.0',
         'NSHumanReadableCopyright': '© 2024 ustwo',
         'NSHighResolutionCapable': True,
+        'NSSupportsAutomaticGraphicsSwitching': True,
+        'LSBackgroundOnly': False,
         'LSMinimumSystemVersion': '10.13.0',
         'NSAppleEventsUsageDescription': 'This app needs to run GAM commands',
         'NSAppleScriptEnabled': True,
         'LSEnvironment': {
             'PYTHONPATH': '@executable_path/../Resources/lib/python3.11/site-packages/',
+            # The bundle ships compiled bytecode; never write any at runtime
+            'PYTHONDONTWRITEBYTECODE': '1',
             'DYLD_LIBRARY_PATH': '@executable_path/../Frameworks/'
         },
         'PyRuntimeLocations': [
@@ -51,16 +102,22 @@ OPTIONS = {
     },
     'frameworks': ['Python.framework'],
     'resources': ['assets', 'config'],
-    'site_packages': True,
-    'strip': False,
-    'debug_modulegraph': True,
-    'optimize': 0
+    'site_packages': False,
+    'semi_standalone': False,
+    'strip': True,
+    'optimize': 2,  # Strip asserts and docstrings from the bundled .pyc files
+    'compressed': True
 }
 
+# USTWO_DEBUG_BUILD=1 builds a bundle that is easier to troubleshoot: the
+# modulegraph is reported, and bytecode keeps its asserts and docstrings
+if os.environ.get('USTWO_DEBUG_BUILD'):
+    OPTIONS.update(debug_modulegraph=True, optimize=0, strip=False)
+
 setup(
     name='ustwo_it_tools',
     app=APP,
     data_files=DATA_FILES,
     options={'py2app': OPTIONS},
-    setup_requires=['py2app'],
+    cmdclass={'py2app': py2app_bytecode_only},
 ) 
\ No newline at end of file
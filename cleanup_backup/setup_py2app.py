@@ -1 +0,0 @@
-from setuptools import setup; APP = ["ustwo_tools.py"]; DATA_FILES = []; OPTIONS = {"packages": ["PyQt5"], "includes": ["config", "Create_Group", "Shared_Drive", "Offboarding"]}; setup(app=APP, data_files=DATA_FILES, options={"py2app": OPTIONS}, setup_requires=["py2app"])
@@ -5,7 +5,7 @@ Provides a tabbed interface for Google Groups, Shared Drives, and Offboarding to
 """
 
 import sys
-import os
+import functools
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, 
                            QVBoxLayout, QWidget)
 from PyQt5.QtGui import QIcon
@@ -16,6 +16,11 @@ from Create_Group import MainWindow as GroupWindow
 from Shared_Drive import MainWindow as DriveWindow
 from Offboarding import MainWindow as OffboardWindow
 
+@functools.lru_cache(maxsize=None)
+def app_icon():
+    """The bundled icon, built once; a null icon if the file is missing"""
+    return QIcon(config.ICON_PATH)
+
 class UstwooTools(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -26,8 +31,7 @@ class UstwooTools(QMainWindow):
         self.setWindowTitle('ustwo IT Tools')
         
         # Set window icon if available
-        if os.path.exists(config.ICON_PATH):
-            self.setWindowIcon(QIcon(config.ICON_PATH))
+        self.setWindowIcon(app_icon())
             
         # Create main widget and layout
         main_widget = QWidget()
@@ -12,6 +12,9 @@ a = Analysis(
         'PyQt5.QtGui',
         'PyQt5.QtWidgets',
         'ustwo_tools',
+        # Imported by name when their tab is first shown
+        'ustwo_tools.Shared_Drive',
+        'ustwo_tools.Offboarding',
         'json',
         'os',
         'sys',
@@ -8,78 +8,87 @@ This module can be run standalone or imported into the unified tools application
 
 import sys
 import os
-import re
-import subprocess
-import json
-import time
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QPixmap, QIcon
+import functools
+import shlex
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel,
-    QLineEdit, QPushButton, QTextEdit, QCheckBox, QDialog, QDialogButtonBox,
-    QPlainTextEdit, QComboBox, QGridLayout, QRadioButton, QGroupBox, QSlider,
-    QScrollArea, QMessageBox
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, QPushButton,
+    QCheckBox, QDialog, QDialogButtonBox, QPlainTextEdit, QGridLayout,
+    QRadioButton, QGroupBox, QScrollArea, QMessageBox
 )
 from . import config
+from .branding import branding_logo, set_app_icon_later
+from .workers import GamRunnable, gam_pool, cancel_tasks, wait_for_tasks, split_addresses
 
-# Path to GAM binary
-GAM_PATH = os.path.expanduser("~/bin/gam7/gam")
+# Path to GAM binary (resolved once in config, honouring the GAM_PATH override)
+GAM_PATH = config.GAM_PATH
 
 # Config file for persistent settings
 CONFIG_FILE = os.path.expanduser("~/.group_tool.json")
 
-##############################################################################
-# WORKER THREAD for GAM COMMANDS
-##############################################################################
-
-class WorkerThread(QThread):
-    line_signal = pyqtSignal(str)
-    done_signal = pyqtSignal(int, list)  # (returncode, all_lines)
+# Style for the external members toggle, applied application-wide so Qt
+# only parses it once
+EXTERNAL_TOGGLE_QSS = """
+    QPushButton#externalToggle {
+        border: 2px solid #999;
+        border-radius: 15px;
+        padding: 5px;
+        background: #ccc;
+        color: #666;
+        font-weight: bold;
+    }
+    QPushButton#externalToggle:checked {
+        background: #2196F3;
+        border-color: #1976D2;
+        color: white;
+    }
+"""
 
-    def __init__(self, cmd_list):
-        super().__init__()
-        self.cmd_list = cmd_list if isinstance(cmd_list, list) else [GAM_PATH] + cmd_list.split()
-        self.captured_lines = []
-
-    def run(self):
-        if not os.path.isfile(self.cmd_list[0]):
-            err_line = f"\n[Error] Could not find 'gam' at {self.cmd_list[0]}"
-            self.line_signal.emit(err_line)
-            self.captured_lines.append(err_line)
-            self.done_signal.emit(1, self.captured_lines)
-            return
+# Queued log lines are written to the log area every LOG_FLUSH_MS, and only
+# the last LOG_MAX_BLOCKS lines are kept
+LOG_FLUSH_MS = 50
+LOG_MAX_BLOCKS = 5000
+
+# Settings that are always applied to a new group
+BASIC_SETTINGS = (
+    "whocanmodifytagsandcategories", "OWNERS_AND_MANAGERS",
+    "whocandeletetopics", "OWNERS_AND_MANAGERS",
+    "whocanapprovemembers", "ALL_MANAGERS_CAN_APPROVE",
+    "whocaninvite", "ALL_MANAGERS_CAN_INVITE",
+    "whocanmodifymembers", "OWNERS_AND_MANAGERS",
+)
 
-        try:
-            proc = subprocess.Popen(
-                self.cmd_list,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            while True:
-                line = proc.stdout.readline()
-                if not line:
-                    break
-                stripped = line.rstrip('\n')
-                self.line_signal.emit(stripped)
-                self.captured_lines.append(stripped)
-
-            err_output = proc.stderr.read()
-            if err_output:
-                for e_line in err_output.splitlines():
-                    combined = f"\n{e_line}"
-                    self.line_signal.emit(combined)
-                    self.captured_lines.append(combined)
-
-            rc = proc.wait()
-            self.done_signal.emit(rc, self.captured_lines)
+# Permission map for translating matrix rows to GAM settings. Values run from
+# least to most restrictive.
+PERMISSION_MAP = (
+    ("whocancontactowner",
+     ("ANYONE_CAN_CONTACT", "ALL_IN_DOMAIN_CAN_CONTACT", "ALL_MEMBERS_CAN_CONTACT", "ALL_MANAGERS_CAN_CONTACT", "ALL_OWNERS_CAN_CONTACT")),
+    ("whocanviewgroup",
+     ("ANYONE_CAN_VIEW", "ALL_IN_DOMAIN_CAN_VIEW", "ALL_MEMBERS_CAN_VIEW", "ALL_MANAGERS_CAN_VIEW", "ALL_OWNERS_CAN_VIEW")),
+    ("whocanpostmessage",
+     ("ANYONE_CAN_POST", "ALL_IN_DOMAIN_CAN_POST", "ALL_MEMBERS_CAN_POST", "ALL_MANAGERS_CAN_POST", "ALL_OWNERS_CAN_POST")),
+    ("whocanviewmembership",
+     ("ALL_IN_DOMAIN_CAN_VIEW", "ALL_MEMBERS_CAN_VIEW", "ALL_MANAGERS_CAN_VIEW", "ALL_OWNERS_CAN_VIEW")),
+)
 
-        except Exception as e:
-            ex_line = f"[Exception] {str(e)}"
-            self.line_signal.emit(ex_line)
-            self.captured_lines.append(ex_line)
-            self.done_signal.emit(1, self.captured_lines)
+@functools.lru_cache(maxsize=32)
+def group_settings(states, who_can_join, allow_external):
+    """
+    Return the 'gam update group' setting/value arguments for a permission
+    matrix state (as returned by PermissionMatrix.state_matrix), a whocanjoin
+    value and the external members toggle.
+    """
+    settings = list(BASIC_SETTINGS)
+    # Only the first rows are mapped; member management is not a GAM setting
+    for row, (setting, values) in zip(states, PERMISSION_MAP):
+        # Highest checked column, or the most restrictive if none are
+        highest_allowed = max((col for col, checked in enumerate(row) if checked), default=0)
+        if highest_allowed < len(values):
+            # Reverse the index since the matrix goes from least to most restrictive
+            settings.extend([setting, values[len(values) - 1 - highest_allowed]])
+    settings.extend(["whocanjoin", who_can_join])
+    settings.extend(["allowexternalmembers", "true" if allow_external else "false"])
+    return tuple(settings)
 
 ##############################################################################
 # PERMISSION MATRIX
@@ -90,6 +99,19 @@ class PermissionMatrix(QGroupBox):
     A 5x5 matrix of checkboxes for group permissions.
     Some combinations are invalid and will not have checkboxes.
     """
+    # Cells that get a checkbox; external (col 4) is not offered for the last
+    # two rows and the entire organisation (col 3) cannot manage members
+    VALID_CELLS = frozenset(
+        (row, col) for row in range(5) for col in range(5)
+        if not ((col == 3 and row == 4) or (col == 4 and row >= 3))
+    )
+    # Checked by default: everything except external and members managing members
+    DEFAULT_CHECKED = frozenset(
+        cell for cell in VALID_CELLS if cell[1] != 4 and cell != (4, 2)
+    )
+    # Group owners always have these permissions
+    MANDATORY = frozenset((row, 0) for row in (0, 1, 3, 4))
+
     def __init__(self, parent=None):
         super().__init__("Access Settings", parent)
         self.init_ui()
@@ -113,56 +135,61 @@ class PermissionMatrix(QGroupBox):
             "Who can view members",
             "Who can manage members"
         ]
-        self.checkboxes = {}
         for row, text in enumerate(rows):
             label = QLabel(text)
             layout.addWidget(label, row + 1, 0)
-            
-            for col in range(5):
-                # Skip invalid combinations
-                if (col == 3 and row == 4) or (col == 4 and row >= 3):
-                    # Add empty spacer widget to maintain grid alignment
-                    spacer = QWidget()
-                    layout.addWidget(spacer, row + 1, col + 1)
-                    continue
-                
-                cb = QCheckBox()
-                # Center the checkbox
-                cb.setStyleSheet("QCheckBox { margin: 0px; padding: 0px; }")
-                layout.addWidget(cb, row + 1, col + 1, 1, 1, Qt.AlignCenter)
-                
-                # Set default states
-                if col == 0:  # Group Owners
-                    cb.setChecked(True)
-                    if row in [0, 1, 3, 4]:  # Mandatory settings
-                        cb.setEnabled(False)
-                elif col == 3:  # Entire organisation
-                    cb.setChecked(True)
-                elif col == 4:  # External
-                    cb.setChecked(False)
-                else:  # Group Managers and Members
-                    if col == 2 and row == 4:  # Members can't manage by default
-                        cb.setChecked(False)
-                    else:
-                        cb.setChecked(True)
-                
-                self.checkboxes[(row, col)] = cb
 
-                # Connect checkbox to handle sliding scale behavior
-                cb.stateChanged.connect(lambda state, r=row, c=col: self.handle_checkbox_change(r, c, state))
+        # Invalid cells are simply left empty in the grid. self.state mirrors
+        # the checkboxes so reading the matrix needs no calls into Qt
+        self.checkboxes = {}
+        self.state = [[False] * 5 for _ in range(5)]
+        for row, col in sorted(self.VALID_CELLS):
+            cb = QCheckBox()
+            # Center the checkbox
+            cb.setStyleSheet("QCheckBox { margin: 0px; padding: 0px; }")
+            layout.addWidget(cb, row + 1, col + 1, 1, 1, Qt.AlignCenter)
+
+            # Set default states
+            cb.setChecked((row, col) in self.DEFAULT_CHECKED)
+            self.state[row][col] = (row, col) in self.DEFAULT_CHECKED
+            if (row, col) in self.MANDATORY:
+                cb.setEnabled(False)
+
+            self.checkboxes[(row, col)] = cb
+
+            # Every checkbox shares one slot, which finds the cell from sender()
+            cb.setProperty("row", row)
+            cb.setProperty("col", col)
+            cb.stateChanged.connect(self.checkbox_changed)
+
+    def state_matrix(self):
+        """Return the checked state of each cell as 5 rows of 5 bools; invalid cells are False"""
+        return tuple(tuple(row) for row in self.state)
+
+    def checkbox_changed(self, state):
+        """Slot shared by every checkbox in the matrix"""
+        cb = self.sender()
+        self.handle_checkbox_change(cb.property("row"), cb.property("col"), state)
 
     def handle_checkbox_change(self, row, col, state):
         """Handle checkbox state changes to implement sliding scale behavior"""
-        if state == Qt.Unchecked:
+        checked = state != Qt.Unchecked
+        self.state[row][col] = checked
+        if not checked:
             # When unchecking a box, uncheck all boxes to the right
-            for c in range(col + 1, 5):
-                if (row, c) in self.checkboxes:
-                    self.checkboxes[(row, c)].setChecked(False)
+            cells = [c for c in range(col + 1, 5) if (row, c) in self.checkboxes]
         else:
             # When checking a box, check all boxes to the left
-            for c in range(col):
-                if (row, c) in self.checkboxes and self.checkboxes[(row, c)].isEnabled():
-                    self.checkboxes[(row, c)].setChecked(True)
+            cells = [c for c in range(col)
+                     if (row, c) in self.checkboxes and self.checkboxes[(row, c)].isEnabled()]
+        # This already covers the whole row, so the cells' own signals are
+        # blocked rather than cascading again
+        for c in cells:
+            cb = self.checkboxes[(row, c)]
+            blocked = cb.blockSignals(True)
+            cb.setChecked(checked)
+            cb.blockSignals(blocked)
+            self.state[row][c] = checked
 
 class JoinSettings(QGroupBox):
     """
@@ -195,21 +222,8 @@ class JoinSettings(QGroupBox):
         self.external_toggle.setCheckable(True)
         self.external_toggle.setFixedWidth(60)
         self.external_toggle.setText("OFF")  # Initial state
-        self.external_toggle.setStyleSheet("""
-            QPushButton {
-                border: 2px solid #999;
-                border-radius: 15px;
-                padding: 5px;
-                background: #ccc;
-                color: #666;
-                font-weight: bold;
-            }
-            QPushButton:checked {
-                background: #2196F3;
-                border-color: #1976D2;
-                color: white;
-            }
-        """)
+        # Styled by EXTERNAL_TOGGLE_QSS, which is set once on the application
+        self.external_toggle.setObjectName("externalToggle")
         self.external_toggle.clicked.connect(self.update_toggle_appearance)
         
         toggle_layout.addWidget(toggle_label)
@@ -225,6 +239,14 @@ class JoinSettings(QGroupBox):
         """Get the current state of the external toggle"""
         return self.external_toggle.isChecked()
 
+    def who_can_join(self):
+        """Get the GAM whocanjoin value for the selected radio button"""
+        if self.radio_anyone.isChecked():
+            return "ALL_IN_DOMAIN_CAN_JOIN"
+        if self.radio_approval.isChecked():
+            return "CAN_REQUEST_TO_JOIN"
+        return "INVITED_CAN_JOIN"  # Invited only
+
 ##############################################################################
 # DIALOGS
 ##############################################################################
@@ -263,12 +285,22 @@ class MultiLineAddressesDialog(QDialog):
 ##############################################################################
 
 class CreateGroupTab(QWidget):
+    # Results of config file I/O, emitted from the config I/O thread
+    config_loaded = pyqtSignal(dict)
+    config_saved = pyqtSignal()
+    config_error = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.init_ui()
 
     def init_ui(self):
-        self.workers = []
+        # GamRunnables queued or running. These are strong references: with
+        # autoDelete off, this set is what keeps a task alive on the pool
+        self.workers = set()
+        # Set from Start until the workflow's last step. Between steps the
+        # workflow may only be waiting on a timer, with no task running
+        self.workflow_running = False
         self.settings = config.load_config(config.GROUP_CONFIG)
         
         # Main horizontal layout for two columns
@@ -287,9 +319,7 @@ class CreateGroupTab(QWidget):
 
         # Logo
         self.logo_label = QLabel()
-        pixmap = QPixmap("/Library/JAMF/Icon/brandingimage.icns")
-        scaled = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.logo_label.setPixmap(scaled)
+        self.logo_label.setPixmap(branding_logo())
         top_hbox.addWidget(self.logo_label)
 
         # Right side inputs
@@ -374,9 +404,15 @@ class CreateGroupTab(QWidget):
         right_layout.addWidget(log_title)
 
         # Log area
-        self.log_area = QTextEdit()
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
+        self.log_area.setMaximumBlockCount(LOG_MAX_BLOCKS)
         right_layout.addWidget(self.log_area)
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_log)
 
         # Add right column to main layout
         main_hbox.addWidget(right_column)
@@ -397,36 +433,80 @@ class CreateGroupTab(QWidget):
         self.btn_quit.clicked.connect(self.close)
         btn_hbox.addWidget(self.btn_quit)
 
-        # Load saved email
+        # Load saved email; only edits made after this need saving
+        self._dirty = False
+        self._config = {}  # Last loaded or saved contents of CONFIG_FILE
+        self.input_email.textEdited.connect(self.mark_dirty)
+        self.config_loaded.connect(self.apply_config)
+        self.config_saved.connect(self.mark_saved)
+        self.config_error.connect(self.log)
         self.load_config()
 
+    def mark_dirty(self, *_):
+        """Record that the saved settings are out of date"""
+        self._dirty = True
+
+    def mark_saved(self):
+        """Record a successful save, unless the email was edited again meanwhile"""
+        if self.input_email.text().strip() == self._config.get('email'):
+            self._dirty = False
+
     def load_config(self):
-        """Load saved configuration including email"""
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    if 'email' in config:
-                        self.input_email.setText(config['email'])
-            except Exception as e:
-                self.log(f"[Warning] Could not load configuration: {str(e)}")
+        """Load saved configuration including email, off the GUI thread"""
+        future = config.run_io(config.load_config, CONFIG_FILE)
+        future.add_done_callback(lambda f: self.config_io_done(f, "load"))
 
-    def save_config(self):
-        """Save configuration including email"""
+    def config_io_done(self, future, action):
+        """Report a finished config read or write back to the GUI thread"""
         try:
-            config = {
-                'email': self.input_email.text().strip()
-            }
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f)
+            result = future.result()
         except Exception as e:
-            self.log(f"[Warning] Could not save configuration: {str(e)}")
+            self.config_error.emit(f"[Warning] Could not {action} configuration: {str(e)}")
+            return
+        if result is False:
+            # save_config reports a failed write by returning False
+            self.config_error.emit(f"[Warning] Could not {action} configuration.")
+            return
+        if action == "load":
+            self.config_loaded.emit(result)
+        else:
+            self.config_saved.emit()
+
+    def apply_config(self, cfg):
+        """Fill in the loaded email unless the user has already edited it"""
+        # Anything saved since the load started is newer than the file
+        self._config = {**cfg, **self._config}
+        if 'email' in cfg and not self._dirty:
+            self.input_email.setText(cfg['email'])
+
+    def save_config(self):
+        """
+        Save configuration including email, if it has been edited;
+        config.save_config skips the write if the file already matches
+        """
+        if not self._dirty:
+            return
+        data = {**self._config, 'email': self.input_email.text().strip()}
+        self._config = data
+        future = config.run_io(config.save_config, CONFIG_FILE, data)
+        future.add_done_callback(lambda f: self.config_io_done(f, "save"))
 
     def log(self, text):
-        self.log_area.append(text)
+        """Queue text for the log area; the timer writes queued lines together"""
+        self._log_buf.append(text)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if self._log_buf:
+            self.log_area.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
 
     def handle_workflow(self):
         """Handle the workflow start button click"""
+        if self.workflow_running:
+            return
+
         # Get user inputs
         self.user_email = self.input_email.text().strip()
         self.group_name = self.input_group_name.text().strip()
@@ -434,11 +514,10 @@ class CreateGroupTab(QWidget):
         self.description = self.input_description.toPlainText().strip()
         
         # Get member lists
-        self.owners = self.parse_addresses(self.input_owners.toPlainText())
-        self.managers = self.parse_addresses(self.input_managers.toPlainText())
-        self.members = self.parse_addresses(self.input_members.toPlainText())
+        self.member_emails, self.member_roles = self.parse_members()
         
         # Clean up previous states
+        self._log_buf.clear()
         self.log_area.clear()
         
         # Validate inputs
@@ -460,6 +539,7 @@ class CreateGroupTab(QWidget):
 
     def create_group(self):
         """Create a Google Group"""
+        self.workflow_running = True
         self.btn_start.setEnabled(False)
         self.log("\nCreating group...")
         
@@ -478,205 +558,109 @@ class CreateGroupTab(QWidget):
         def creation_done(rc, lines):
             if rc != 0:
                 self.log("\n[Error] Failed to create the group.")
-                self.btn_start.setEnabled(True)
+                self.finish_workflow()
                 return
             
             self.log("\nGroup created successfully. Waiting for propagation...")
-            # Add a small delay before verification
-            time.sleep(5)
-            self.verify_group_exists()
+            # Give Google a moment before verifying, without blocking the UI
+            QTimer.singleShot(5000, self.verify_group_exists)
         
-        worker = WorkerThread(cmd)
-        worker.line_signal.connect(self.log)
-        worker.done_signal.connect(creation_done)
-        worker.finished.connect(lambda: self.cleanup_thread(worker))
-        worker.start()
-        self.workers.append(worker)
+        self.start_worker(cmd, creation_done)
 
     def verify_group_exists(self, attempts=0):
         """Verify the group exists, with retries"""
+        if not self.workflow_running:
+            return  # Closed while waiting
+
         cmd = [GAM_PATH, "info", "group", self.group_email]
 
         def verify_done(rc, lines):
             if rc != 0:
                 if attempts < 3:  # Try up to 3 times
                     self.log("\nGroup not found yet. Waiting 30 seconds...")
-                    time.sleep(30)
-                    self.verify_group_exists(attempts + 1)
+                    QTimer.singleShot(30000, lambda: self.verify_group_exists(attempts + 1))
                 else:
                     # Even if verification fails, we'll proceed since the create command succeeded
                     self.log("\n[Warning] Group verification timed out, but group was created successfully.")
                     self.log("\nProceeding with member addition...")
-                    if any([self.owners, self.managers, self.members]):
+                    if self.member_emails:
                         self.process_members()
                     else:
                         self.configure_permissions()
                 return
             
             self.log("\nGroup verified. Processing members...")
-            if any([self.owners, self.managers, self.members]):
+            if self.member_emails:
                 self.process_members()
             else:
                 self.configure_permissions()
 
-        worker = WorkerThread(cmd)
-        worker.line_signal.connect(self.log)
-        worker.done_signal.connect(verify_done)
-        worker.finished.connect(lambda: self.cleanup_thread(worker))
-        worker.start()
-        self.workers.append(worker)
+        self.start_worker(cmd, verify_done)
 
     def process_members(self):
-        """Add members to the group with their respective roles"""
+        """Add all members to the group with their respective roles"""
         self.log("\nAdding members to the group...")
         
-        # Track progress
-        self.total_members = len(self.owners) + len(self.managers) + len(self.members)
-        self.processed_members = 0
-        
-        def member_added(rc, lines):
-            self.processed_members += 1
-            if rc != 0:
-                self.log("\n[Warning] Failed to add a member.")
-            
-            if self.processed_members >= self.total_members:
-                self.log("\nAll members processed.")
-                self.configure_permissions()  # Configure permissions after members
-        
-        # Add owners first
-        for owner in self.owners:
-            cmd = [GAM_PATH, "update", "group", self.group_email, "add", "owner", owner]
-            worker = WorkerThread(cmd)
-            worker.line_signal.connect(self.log)
-            worker.done_signal.connect(member_added)
-            worker.finished.connect(lambda: self.cleanup_thread(worker))
-            worker.start()
-            self.workers.append(worker)
-        
-        # Add managers
-        for manager in self.managers:
-            cmd = [GAM_PATH, "update", "group", self.group_email, "add", "manager", manager]
-            worker = WorkerThread(cmd)
-            worker.line_signal.connect(self.log)
-            worker.done_signal.connect(member_added)
-            worker.finished.connect(lambda: self.cleanup_thread(worker))
-            worker.start()
-            self.workers.append(worker)
-        
-        # Add members
-        for member in self.members:
-            cmd = [GAM_PATH, "update", "group", self.group_email, "add", "member", member]
-            worker = WorkerThread(cmd)
-            worker.line_signal.connect(self.log)
-            worker.done_signal.connect(member_added)
-            worker.finished.connect(lambda: self.cleanup_thread(worker))
-            worker.start()
-            self.workers.append(worker)
-
-    def configure_permissions(self):
-        """Configure group permissions based on matrix settings"""
-        self.log("\nConfiguring group permissions...")
-        
-        # Basic settings that are always applied
-        basic_settings = [
-            "whocanmodifytagsandcategories", "OWNERS_AND_MANAGERS",
-            "whocandeletetopics", "OWNERS_AND_MANAGERS",
-            "whocanapprovemembers", "ALL_MANAGERS_CAN_APPROVE",
-            "whocaninvite", "ALL_MANAGERS_CAN_INVITE",
-            "whocanmodifymembers", "OWNERS_AND_MANAGERS"
-        ]
-        
-        # Permission map for translating matrix positions to GAM settings
-        permission_map = [
-            {
-                "setting": "whocancontactowner",
-                "values": ["ANYONE_CAN_CONTACT", "ALL_IN_DOMAIN_CAN_CONTACT", "ALL_MEMBERS_CAN_CONTACT", "ALL_MANAGERS_CAN_CONTACT", "ALL_OWNERS_CAN_CONTACT"]
-            },
-            {
-                "setting": "whocanviewgroup",
-                "values": ["ANYONE_CAN_VIEW", "ALL_IN_DOMAIN_CAN_VIEW", "ALL_MEMBERS_CAN_VIEW", "ALL_MANAGERS_CAN_VIEW", "ALL_OWNERS_CAN_VIEW"]
-            },
-            {
-                "setting": "whocanpostmessage",
-                "values": ["ANYONE_CAN_POST", "ALL_IN_DOMAIN_CAN_POST", "ALL_MEMBERS_CAN_POST", "ALL_MANAGERS_CAN_POST", "ALL_OWNERS_CAN_POST"]
-            },
-            {
-                "setting": "whocanviewmembership",
-                "values": ["ALL_IN_DOMAIN_CAN_VIEW", "ALL_MEMBERS_CAN_VIEW", "ALL_MANAGERS_CAN_VIEW", "ALL_OWNERS_CAN_VIEW"]
-            }
+        # One add per role, each given the whole comma-separated list
+        by_role = {}
+        for email, role in zip(self.member_emails, self.member_roles):
+            by_role.setdefault(role, []).append(email)
+        member_commands = [
+            ["update", "group", self.group_email, "add", role, "users", ",".join(emails)]
+            for role, emails in by_role.items()
         ]
+        # The adds are sent to GAM together with the settings update
+        self.configure_permissions(member_commands)
+
+    def configure_permissions(self, member_commands=()):
+        """
+        Configure group permissions based on matrix settings. Any member
+        commands are run by the same GAM process.
+        """
+        if not self.workflow_running:
+            return
+        self.log("\nConfiguring group permissions...")
         
-        permission_settings = []
+        permission_settings = group_settings(
+            self.perm_matrix.state_matrix(),
+            self.join_settings.who_can_join(),
+            self.join_settings.value()
+        )
+
+        # Apply basic settings, permissions and the external setting in one update
+        settings_command = ["update", "group", self.group_email] + list(permission_settings)
+        commands = [*member_commands, settings_command]
         
-        # Process permission matrix
-        for row in range(4):  # Only process first 4 rows, skip member management
-            highest_allowed = 0  # Start with most restrictive
-            for col in range(5):
-                # Skip invalid combinations
-                if (col == 3 and row == 4) or (col == 4 and row >= 3):
-                    continue
-                    
-                # Only check boxes that exist
-                if (row, col) in self.perm_matrix.checkboxes:
-                    if self.perm_matrix.checkboxes[(row, col)].isChecked():
-                        highest_allowed = col
-            
-            # Set appropriate permission level
-            perm = permission_map[row]
-            if highest_allowed < len(perm["values"]):
-                # Reverse the index since the matrix goes from least to most restrictive
-                value_index = len(perm["values"]) - 1 - highest_allowed
-                if value_index >= 0:
-                    permission_settings.extend([perm["setting"], perm["values"][value_index]])
-
-        # Process join settings
-        if self.join_settings.radio_anyone.isChecked():
-            permission_settings.extend(["whocanjoin", "ALL_IN_DOMAIN_CAN_JOIN"])
-        elif self.join_settings.radio_approval.isChecked():
-            permission_settings.extend(["whocanjoin", "CAN_REQUEST_TO_JOIN"])
-        else:  # Invited only
-            permission_settings.extend(["whocanjoin", "INVITED_CAN_JOIN"])
-
-        # Step 1: Apply basic settings and permissions
-        cmd1 = [
-            GAM_PATH, "update", "group", self.group_email
-        ] + basic_settings + permission_settings
+        if len(commands) == 1:
+            cmd, stdin_data = [GAM_PATH, *settings_command], None
+        else:
+            # Every command is fed over stdin to a single 'gam tbatch -', so
+            # GAM starts and authenticates once instead of once per command
+            cmd = [GAM_PATH, "tbatch", "-"]
+            stdin_data = "".join(shlex.join(["gam", *c]) + "\n" for c in commands)
         
         def settings_done(rc, lines):
             if rc != 0:
-                self.log("\n[Error] Failed to update group settings.")
-                self.btn_start.setEnabled(True)
-                return
-            
-            # Step 2: Handle external members setting separately
-            external_setting = "true" if self.join_settings.value() else "false"
-            cmd2 = [
-                GAM_PATH, "update", "group", self.group_email,
-                "allowexternalmembers", external_setting
-            ]
-            
-            def external_done(rc, lines):
-                if rc != 0:
-                    self.log("\n[Warning] Failed to update external members setting.")
-                
-                self.verify_settings()
+                if member_commands:
+                    # The batch does not say which command failed; the
+                    # settings are checked below either way, so a failure
+                    # still reported after that is a member add
+                    self.log("\n[Warning] One or more member adds or settings updates failed; see the GAM output above.")
+                else:
+                    self.log("\n[Error] Failed to update group settings.")
+                    self.finish_workflow()
+                    return
+            elif member_commands:
+                self.log("\nAll members processed.")
             
-            worker = WorkerThread(cmd2)
-            worker.line_signal.connect(self.log)
-            worker.done_signal.connect(external_done)
-            worker.finished.connect(lambda: self.cleanup_thread(worker))
-            worker.start()
-            self.workers.append(worker)
+            self.verify_settings()
         
-        worker = WorkerThread(cmd1)
-        worker.line_signal.connect(self.log)
-        worker.done_signal.connect(settings_done)
-        worker.finished.connect(lambda: self.cleanup_thread(worker))
-        worker.start()
-        self.workers.append(worker)
+        self.start_worker(cmd, settings_done, stdin_data, check_errors=bool(member_commands))
 
     def verify_settings(self, attempts=0):
         """Verify group settings after configuration"""
+        if not self.workflow_running:
+            return
         self.log("\nVerifying group settings...")
         
         cmd = [GAM_PATH, "info", "group", self.group_email]
@@ -685,87 +669,129 @@ class CreateGroupTab(QWidget):
             if rc != 0:
                 if attempts < 3:
                     self.log("\nSettings not updated yet, retrying...")
-                    time.sleep(2)
-                    self.verify_settings(attempts + 1)
-                else:
-                    self.log("\n[Error] Could not verify group settings.")
-                self.btn_start.setEnabled(True)
+                    QTimer.singleShot(2000, lambda: self.verify_settings(attempts + 1))
+                    return
+                self.log("\n[Error] Could not verify group settings.")
+                self.finish_workflow()
                 return
             
-            self.log("\nGroup settings verified successfully!")
+            # Index the 'key: value' lines once, then look up each setting
+            info = {key.strip(): value.strip()
+                    for key, sep, value in (line.partition(":") for line in lines) if sep}
+            expected = {
+                "allowExternalMembers": "true" if self.join_settings.value() else "false",
+                "whoCanJoin": self.join_settings.who_can_join(),
+            }
+            mismatched = False
+            for key, value in expected.items():
+                actual = info.get(key)
+                if actual is not None and actual.lower() != value.lower():
+                    self.log(f"\n[Warning] {key} is {actual}, expected {value}")
+                    mismatched = True
+            
+            if mismatched:
+                self.log("\n[Warning] Some settings may not have been applied correctly.")
+            else:
+                self.log("\nGroup settings verified successfully!")
             self.log("\nGroup URL: https://groups.google.com/a/ustwo.com/g/" + self.group_email.split("@")[0])
-            self.btn_start.setEnabled(True)
-        
-        worker = WorkerThread(cmd)
-        worker.line_signal.connect(self.log)
-        worker.done_signal.connect(verify_done)
-        worker.finished.connect(lambda: self.cleanup_thread(worker))
-        worker.start()
-        self.workers.append(worker)
+            self.finish_workflow()
+        
+        self.start_worker(cmd, verify_done)
+
+    def finish_workflow(self):
+        """End the workflow, successful or not, and allow another to start"""
+        self.workflow_running = False
+        self.btn_start.setEnabled(True)
+
+    def parse_members(self):
+        """
+        Parse the owner, manager and member boxes in one pass into parallel
+        email and role lists. Addresses are lower-cased, as Google compares
+        them case-insensitively, and an address listed more than once keeps
+        the first (highest) role it was given.
+        """
+        emails, roles, seen = [], [], set()
+        for role, box in (("owner", self.input_owners),
+                          ("manager", self.input_managers),
+                          ("member", self.input_members)):
+            for email in self.parse_addresses(box.toPlainText()):
+                email = email.lower()
+                if email not in seen:
+                    seen.add(email)
+                    emails.append(email)
+                    roles.append(role)
+        return emails, roles
 
     def parse_addresses(self, text):
         """Parse email addresses from text input"""
-        replaced = text.replace(",", " ")
-        return [x.strip() for x in replaced.split() if x.strip()]
+        return list(split_addresses(text))
 
     def show_warning(self, title, message):
         """Show a warning dialog"""
-        dlg = QDialog(self)
-        dlg.setWindowTitle(title)
-        dlg.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
-        layout = QVBoxLayout(dlg)
-
-        lbl = QLabel(message)
-        lbl.setWordWrap(True)
-        layout.addWidget(lbl)
-
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok)
-        buttons.accepted.connect(dlg.accept)
-        layout.addWidget(buttons)
-
-        dlg.exec_()
+        # Qt's stock dialog; it takes the branding icon from the application
+        QMessageBox.warning(self, title, message)
 
     def closeEvent(self, event):
         """Handle application closure"""
-        for w in self.workers:
-            if w.isRunning():
-                self.log("\n[Info] Waiting for background tasks to complete...")
-                w.wait(2000)
-                if w.isRunning():
-                    self.log("\n[Warning] Forcibly terminating background task.")
-                    w.terminate()
+        # Steps still waiting on a retry timer, or on a task's result, stop
+        # there instead of starting more GAM commands
+        self.workflow_running = False
+        # This tab's tasks that have not started yet are dropped; running ones
+        # are cancelled, which stops their GAM process. The pool is shared, so
+        # other tools' tasks carry on.
+        cancel_tasks(self.workers)
+        if self.workers:
+            self.log("\n[Info] Waiting for background tasks to complete...")
+            if not wait_for_tasks(self.workers, 2000):
+                self.log("\n[Warning] Background tasks are still running.")
         super().closeEvent(event)
 
     def save_settings(self):
         """Save current settings to config file"""
         config.save_config(config.GROUP_CONFIG, self.settings)
 
+    def start_worker(self, cmd, on_done=None, stdin_data=None, check_errors=False):
+        """
+        Run a GAM command on the GAM thread pool, logging its output. With
+        check_errors, on_done is given a non-zero returncode if any output
+        line reported a failure, since 'gam tbatch' exits 0 when only some
+        of its commands fail.
+        """
+        worker = GamRunnable(cmd, stdin_data=stdin_data)
+        worker.signals.line_signal.connect(self.log)
+        if on_done is not None and check_errors:
+            worker.signals.done_signal.connect(
+                lambda rc, lines: on_done(rc or int(worker.error_lines > 0), lines))
+        elif on_done is not None:
+            worker.signals.done_signal.connect(on_done)
+        worker.signals.finished.connect(lambda: self.cleanup_thread(worker))
+        self.workers.add(worker)
+        gam_pool().start(worker)
+
     def run_gam_command(self, command):
         """Run a GAM command using the configured GAM path"""
-        full_command = f"{config.GAM_PATH} {command}"
-        worker = WorkerThread(full_command)
-        worker.line_signal.connect(self.log)
-        worker.finished.connect(lambda: self.cleanup_thread(worker))
-        worker.start()
-        self.workers.append(worker)
+        self.start_worker([GAM_PATH, *shlex.split(command)])
         
     def cleanup_thread(self, worker):
-        """Remove the thread from our tracking list once it's done"""
+        """Remove the task from our tracking list once it's done"""
         if worker in self.workers:
-            self.workers.remove(worker)
+            self.workers.discard(worker)
+            worker.signals.deleteLater()
         self.command_finished()
         
     def command_finished(self):
-        """Enable buttons if all threads are done"""
-        if not self.workers:
+        """Enable buttons if all tasks are done and no workflow is in progress"""
+        if not self.workers and not self.workflow_running:
             self.btn_start.setEnabled(True)
 
 def standalone():
     """Run this tool as a standalone application"""
+    from PyQt5.QtWidgets import QApplication
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
+    app.setStyleSheet(EXTERNAL_TOGGLE_QSS)
     w = CreateGroupTab()
     w.show()
+    set_app_icon_later(app)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
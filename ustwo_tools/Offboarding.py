@@ -5,50 +5,72 @@ Provides functionality for offboarding users from Google Workspace.
 """
 
 import sys
-import os
-import subprocess
 import json
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                          QHBoxLayout, QLabel, QLineEdit, QPlainTextEdit,
-                          QPushButton, QGroupBox, QCheckBox, QScrollArea,
-                          QTextEdit, QMessageBox)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon
+import shlex
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                          QPlainTextEdit, QPushButton, QGroupBox)
+from PyQt5.QtCore import Qt, QProcess, pyqtSignal
 import logging
 
 from . import config
+from .workers import valid_addresses
 
-class WorkerThread(QThread):
+class GamProcess(QProcess):
+    """
+    A GAM command run through QProcess. Output is delivered by Qt's event
+    loop as it arrives, so no worker thread is needed.
+    """
     output = pyqtSignal(str)
-    finished = pyqtSignal()
+    done = pyqtSignal()
 
-    def __init__(self, command):
-        super().__init__()
+    def __init__(self, command, parent=None, stdin_data=None):
+        super().__init__(parent)
         self.command = command
+        self.stdin_data = stdin_data
+        self.pending = b""
+        self.setProcessChannelMode(QProcess.MergedChannels)
+        self.readyReadStandardOutput.connect(self.read_output)
+        self.finished.connect(self.process_finished)
+        self.errorOccurred.connect(self.process_error)
+
+    def start_command(self):
+        self.start(self.command[0], self.command[1:])
+        if self.stdin_data is not None:
+            # Qt buffers this until the process has started, and only closes
+            # stdin once everything has been written
+            self.write(self.stdin_data.encode("utf-8"))
+            self.closeWriteChannel()
+
+    def read_output(self):
+        # Emit every complete line received so far as a single batch and
+        # hold back any trailing partial line for the next read
+        data = self.pending + bytes(self.readAll())
+        complete, sep, self.pending = data.rpartition(b"\n")
+        if sep:
+            self.output.emit(self.decode_lines(complete))
+
+    def process_finished(self):
+        if self.pending:
+            self.output.emit(self.decode_lines(self.pending))
+            self.pending = b""
+        self.done.emit()
+
+    def process_error(self, error):
+        # A process that never started will not emit finished
+        if error == QProcess.FailedToStart:
+            self.output.emit(f"Error: {self.errorString()}")
+            self.done.emit()
 
-    def run(self):
-        try:
-            process = subprocess.Popen(
-                self.command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                shell=True
-            )
-            
-            for line in process.stdout:
-                self.output.emit(line.strip())
-            
-            process.wait()
-            self.finished.emit()
-        except Exception as e:
-            self.output.emit(f"Error: {str(e)}")
-            self.finished.emit()
+    @staticmethod
+    def decode_lines(data):
+        """Decode a block of output and strip each of its lines"""
+        text = data.decode("utf-8", errors="replace")
+        return "\n".join(line.strip() for line in text.splitlines())
 
 class OffboardingTab(QWidget):
     def __init__(self):
         super().__init__()
-        self.worker_threads = []  # List to track all worker threads
+        self.processes = []  # GAM commands still in flight
         self.init_ui()
 
     def init_ui(self):
@@ -130,31 +152,60 @@ class OffboardingTab(QWidget):
         """Add text to the output log"""
         self.output_log.appendPlainText(text)
 
-    def run_gam_command(self, command):
-        """Run a GAM command using the configured GAM path"""
-        full_command = f"{config.GAM_PATH} {command}"
-        worker = WorkerThread(full_command)
-        worker.output.connect(self.log_output)
-        worker.finished.connect(self.command_finished)
-        worker.finished.connect(lambda: self.cleanup_thread(worker))  # Clean up thread when finished
-        self.worker_threads.append(worker)  # Track the thread
-        worker.start()
-
-    def cleanup_thread(self, worker):
-        """Remove the worker thread from our list when it's done"""
-        if worker in self.worker_threads:
-            self.worker_threads.remove(worker)
-
-    def command_finished(self):
+    def run_gam_command(self, args, stdin_data=None):
+        """Run a GAM command (a list of arguments) using the configured GAM path"""
+        process = GamProcess([config.GAM_PATH, *args], self, stdin_data)
+        process.output.connect(self.log_output)
+        process.done.connect(lambda: self.command_finished(process))
+        self.processes.append(process)
+        process.start_command()
+        return process
+
+    def command_finished(self, process):
         """Handle command completion"""
+        if process in self.processes:
+            self.processes.remove(process)
+            process.deleteLater()
         # Only enable buttons if all commands have completed
-        if not self.worker_threads:
+        if not self.processes:
             self.start_button.setEnabled(True)
             self.quit_button.setEnabled(True)
 
+    @staticmethod
+    def offboarding_steps(email):
+        """Return (log message, GAM arguments) for each offboarding step"""
+        return [
+            # Find manager email for group transfer
+            ("Finding manager for the user...",
+             ["user", email, "print", "manager"]),
+            # Check for owned groups. NOTE: In a real implementation, we would
+            # capture the output and transfer groups to the manager; for now,
+            # we'll just show the groups.
+            ("Finding and transferring owned groups...",
+             ["user", email, "print", "groups", "roles", "owner"]),
+            ("Removing user from all groups...",
+             ["user", email, "delete", "groups"]),
+            # In a real implementation, we'd need to run commands to get the
+            # name first and then use those results to set the vacation message
+            ("Setting out of office message...",
+             ["user", email, "vacation", "on",
+              "subject", "This person is no longer with ustwo",
+              "message", "Thank you for your email, however this person is no longer with ustwo."]),
+            # Both user attributes are changed with a single update
+            ("Resetting password and hiding user from directory...",
+             ["update", "user", email, "password", "random", "gal", "false"]),
+            ("Signing out from all devices...",
+             ["user", email, "signout"]),
+            ("Moving user to Leavers OU...",
+             ["update", "org", "/Leavers", "add", "users", email]),
+        ]
+
     def start_offboarding(self):
         """Start the offboarding process for the entered email addresses"""
-        emails = self.email_input.toPlainText().strip().split('\n')
+        # Each user is offboarded once, however often they were entered
+        emails, skipped = valid_addresses(self.email_input.toPlainText())
+        if skipped:
+            self.log_output(f"Skipping invalid email addresses: {', '.join(skipped)}")
         if not emails:
             self.log_output("Error: No email addresses entered")
             return
@@ -162,66 +213,33 @@ class OffboardingTab(QWidget):
         self.start_button.setEnabled(False)
         self.quit_button.setEnabled(False)
         
+        # Every step for every user is fed over stdin to a single
+        # 'gam tbatch -', which runs the lines on threads inside that one GAM
+        # process rather than starting a new GAM process for each line
+        batch_lines = []
         for email in emails:
-            email = email.strip()
-            if not email:
-                continue
-                
             self.log_output(f"\nProcessing {email}...")
-            
-            # Find manager email for group transfer
-            self.log_output("Finding manager for the user...")
-            self.run_gam_command(f"user {email} print manager | awk -F, 'NR>1 {{if ($4 != \"\") print $4}}'")
-            
-            # Check for owned groups and transfer ownership
-            self.log_output("Finding and transferring owned groups...")
-            # First get the list of owned groups
-            self.run_gam_command(f"user {email} print groups roles owner")
-            # NOTE: In a real implementation, we would capture the output and 
-            # transfer groups to the manager, but this would require more complex
-            # inter-thread communication. For now, we'll just show the groups.
-            self.log_output("Group transfer would require capturing output between commands.")
-            self.log_output("See the bash script for the full implementation.")
-            
-            # Remove from all groups
-            self.log_output("Removing user from all groups...")
-            self.run_gam_command(f"user {email} delete groups")
-            
-            # Set out of office message
-            self.log_output("Setting out of office message...")
-            # In a real implementation, we'd need to run commands to get the name first
-            # and then use those results to set the vacation message
-            self.run_gam_command(f"user {email} vacation on subject \"This person is no longer with ustwo\" message \"Thank you for your email, however this person is no longer with ustwo.\"")
-            
-            # Reset password
-            self.log_output("Resetting password...")
-            self.run_gam_command(f"update user {email} password random")
-            
-            # Sign out from all devices
-            self.log_output("Signing out from all devices...")
-            self.run_gam_command(f"user {email} signout")
-            
-            # Hide from directory
-            self.log_output("Hiding user from directory...")
-            self.run_gam_command(f"update user {email} gal false")
-            
-            # Move to Leavers OU
-            self.log_output("Moving user to Leavers OU...")
-            self.run_gam_command(f"update org '/Leavers' add users {email}")
+            for message, args in self.offboarding_steps(email):
+                self.log_output(message)
+                batch_lines.append(shlex.join(["gam", *args]))
+        self.log_output("Group transfer would require capturing output between commands.")
+        self.log_output("See the bash script for the full implementation.")
+        
+        self.run_gam_command(["tbatch", "-"], "\n".join(batch_lines) + "\n")
 
     def closeEvent(self, event):
         """Handle window closing event"""
-        # Wait for all worker threads to finish
-        for worker in self.worker_threads[:]:
-            worker.wait()
-            self.worker_threads.remove(worker)
-            
+        # Let any in-flight GAM commands complete
+        for process in self.processes[:]:
+            process.waitForFinished(-1)
         super().closeEvent(event)
 
 if __name__ == '__main__':
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QIcon
     app = QApplication(sys.argv)
-    if os.path.exists(config.ICON_PATH):
-        app.setWindowIcon(QIcon(config.ICON_PATH))
+    # A missing icon file just gives a null icon, so no existence check
+    app.setWindowIcon(QIcon(config.ICON_PATH))
     window = OffboardingTab()
     window.show()
     sys.exit(app.exec_()) 
\ No newline at end of file
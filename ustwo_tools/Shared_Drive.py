@@ -10,19 +10,24 @@ This module can be run standalone or imported into the unified tools application
 import sys
 import os
 import re
-import subprocess
-import json
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QPixmap, QIcon
+import csv
+import io
+import shlex
+import weakref
+from collections import deque
+from PyQt5.QtCore import Qt, QEventLoop, pyqtSignal, QTimer
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel,
-    QLineEdit, QPushButton, QTextEdit, QCheckBox, QDialog, QDialogButtonBox,
-    QPlainTextEdit, QComboBox, QGroupBox, QScrollArea, QMessageBox
+    QWidget, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, QPushButton,
+    QCheckBox, QDialog, QDialogButtonBox, QPlainTextEdit, QComboBox, QMessageBox
 )
 from . import config
+from .branding import branding_logo, set_app_icon_later
+from .workers import (
+    GamRunnable, gam_pool, cancel_tasks, wait_for_tasks, valid_addresses
+)
 
-# Path to GAM binary
-GAM_PATH = os.path.expanduser("~/bin/gam7/gam")
+# Path to GAM binary (resolved once in config, honouring the GAM_PATH override)
+GAM_PATH = config.GAM_PATH
 
 # Template folder ID with contents to copy
 INTERNAL_FOLDER_ID = "1rfE8iB-kt96m5JSJwX-X87OxTI5J7hIi"
@@ -40,98 +45,66 @@ WEB_TO_GAM = {
 }
 WEB_ROLE_LIST = list(WEB_TO_GAM.keys())
 
-##############################################################################
-# WORKER THREAD for GAM COMMANDS
-##############################################################################
-
-class WorkerThread(QThread):
-    """Worker thread for executing GAM commands"""
-    line_signal = pyqtSignal(str)
-    done_signal = pyqtSignal(int, list)  # (returncode, all_lines)
-    finished = pyqtSignal()  # Add finished signal for backward compatibility
-
-    def __init__(self, cmd_list):
-        super().__init__()
-        self.cmd_list = cmd_list
-        self.captured_lines = []
-
-    def run(self):
-        if not os.path.isfile(self.cmd_list[0]):
-            err_line = f"\n[Error] Could not find 'gam' at {self.cmd_list[0]}"
-            self.line_signal.emit(err_line)
-            self.captured_lines.append(err_line)
-            self.done_signal.emit(1, self.captured_lines)
-            self.finished.emit()
-            return
-
-        try:
-            proc = subprocess.Popen(
-                self.cmd_list,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            while True:
-                line = proc.stdout.readline()
-                if not line:
-                    break
-                stripped = line.rstrip('\n')
-                self.line_signal.emit(stripped)
-                self.captured_lines.append(stripped)
+# The ID GAM prints when it creates a Shared Drive
+_DRIVE_ID_RE = re.compile(r"Shared Drive ID:[ \t]*(\S+)")
 
-            err_output = proc.stderr.read()
-            if err_output:
-                for e_line in err_output.splitlines():
-                    combined = f"\n{e_line}"
-                    self.line_signal.emit(combined)
-                    self.captured_lines.append(combined)
+# How long log lines are collected before being written to the log area,
+# and how many lines the log area keeps
+LOG_FLUSH_MS = 16
+LOG_MAX_BLOCKS = 5000
 
-            rc = proc.wait()
-            self.done_signal.emit(rc, self.captured_lines)
-
-        except Exception as e:
-            ex_line = f"[Exception] {str(e)}"
-            self.line_signal.emit(ex_line)
-            self.captured_lines.append(ex_line)
-            self.done_signal.emit(1, self.captured_lines)
-        
-        self.finished.emit()
+# Rows of a 'gam csv' batch that GAM works on at once. Drive allows about
+# 10 writes a second per user, so more threads would only be throttled.
+GAM_CSV_THREADS = 10
 
 ##############################################################################
 # CUSTOM DIALOGS
 ##############################################################################
 
+# Dialogs are built once per parent window and reused for every prompt
+_dialog_cache = weakref.WeakValueDictionary()
+
+def shared_dialog(dialog_class, parent=None):
+    """Return the dialog_class instance for parent, creating it on first use"""
+    key = (dialog_class, id(parent))
+    dlg = _dialog_cache.get(key)
+    if dlg is None:
+        dlg = dialog_class(parent=parent)
+        _dialog_cache[key] = dlg
+    return dlg
+
 class CustomYesNoDialog(QDialog):
     """
     A custom "Yes/No" dialog with a branded icon and text.
     We return True if user clicked "Yes," False if user clicked "No."
     """
-    def __init__(self, title, question, parent=None):
+    def __init__(self, title="", question="", parent=None):
         super().__init__(parent)
         self.setWindowTitle(title)
-        # Set the same icon
-        self.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
+        # The branding icon comes from the application icon
         self.setModal(True)
 
         main_layout = QVBoxLayout(self)
 
-        label = QLabel(question)
-        label.setWordWrap(True)
-        main_layout.addWidget(label)
+        self.label = QLabel(question)
+        self.label.setWordWrap(True)
+        main_layout.addWidget(self.label)
 
         button_box = QDialogButtonBox(QDialogButtonBox.Yes | QDialogButtonBox.No)
-        button_box.button(QDialogButtonBox.Yes).setText("Yes")
-        button_box.button(QDialogButtonBox.No).setText("No")
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
 
         main_layout.addWidget(button_box)
-        self.setLayout(main_layout)
+
+    def set_question(self, title, question):
+        self.setWindowTitle(title)
+        self.label.setText(question)
+        self.adjustSize()
 
     @staticmethod
     def ask(title, question, parent=None):
-        dlg = CustomYesNoDialog(title, question, parent)
+        dlg = shared_dialog(CustomYesNoDialog, parent)
+        dlg.set_question(title, question)
         result = dlg.exec_()
         return (result == QDialog.Accepted)
 
@@ -143,7 +116,6 @@ class SelectRoleDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Select Role")
-        self.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
         self.setModal(True)
 
         layout = QVBoxLayout(self)
@@ -159,14 +131,16 @@ class SelectRoleDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
-        self.setLayout(layout)
-
     def selected_role(self):
         return self.combo.currentText()
 
+    def reset(self):
+        self.combo.setCurrentIndex(0)
+
     @staticmethod
     def get_role(parent=None):
-        dlg = SelectRoleDialog(parent)
+        dlg = shared_dialog(SelectRoleDialog, parent)
+        dlg.reset()
         result = dlg.exec_()
         if result == QDialog.Accepted:
             return dlg.selected_role()
@@ -180,7 +154,6 @@ class MultiLineAddressesDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Enter Addresses")
-        self.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
         self.setModal(True)
 
         layout = QVBoxLayout(self)
@@ -197,9 +170,14 @@ class MultiLineAddressesDialog(QDialog):
     def get_text(self):
         return self.text_edit.toPlainText()
 
+    def reset(self):
+        self.text_edit.clear()
+        self.text_edit.setFocus()
+
     @staticmethod
     def get_addresses(parent=None):
-        dlg = MultiLineAddressesDialog(parent)
+        dlg = shared_dialog(MultiLineAddressesDialog, parent)
+        dlg.reset()
         result = dlg.exec_()
         if result == QDialog.Accepted:
             return dlg.get_text()
@@ -211,6 +189,10 @@ class MultiLineAddressesDialog(QDialog):
 ##############################################################################
 
 class SharedDriveTab(QWidget):
+    # Results of config file I/O, emitted from the config I/O thread
+    config_loaded = pyqtSignal(dict)
+    config_error = pyqtSignal(str)
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Google Shared Drive Creation Tool")
@@ -218,13 +200,23 @@ class SharedDriveTab(QWidget):
         self.init_ui()
 
     def init_ui(self):
-        self.workers = []
+        # GamRunnables queued or running. These are strong references: with
+        # autoDelete off, this set is what keeps a task alive on the pool
+        self.workers = set()
+        # Local event loops of run_blocking_command calls still waiting
+        self.blocking_loops = set()
+        self.closing = False
         self.drive_ids = {}
-        self.main_members = []
+        self.pending_drives = set()  # Drives whose creation has not finished
+        self.same_members = {}  # Extra drive label -> reuse main membership
+        self.adding_members = False
+        self.main_members = {}  # Web role -> set of addresses added to main with it
         self.processed_count = 0
         self.total_addresses = 0
         self.processed_pairs = 0
         self.total_pairs = 0
+        self._log_buffer = deque()
+        self._log_flush_pending = False
         
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -234,9 +226,7 @@ class SharedDriveTab(QWidget):
         main_layout.addLayout(top_hbox)
 
         self.logo_label = QLabel()
-        pixmap = QPixmap("/Library/JAMF/Icon/brandingimage.icns")
-        scaled = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.logo_label.setPixmap(scaled)
+        self.logo_label.setPixmap(branding_logo())
         top_hbox.addWidget(self.logo_label)
 
         right_vbox = QVBoxLayout()
@@ -261,8 +251,9 @@ class SharedDriveTab(QWidget):
         right_vbox.addWidget(self.copy_checkbox)
 
         # Log area
-        self.log_area = QTextEdit()
+        self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
+        self.log_area.setMaximumBlockCount(LOG_MAX_BLOCKS)
         main_layout.addWidget(self.log_area)
 
         # Buttons
@@ -280,29 +271,43 @@ class SharedDriveTab(QWidget):
         self.setMinimumSize(900, 600)
         
         # Load saved email
+        self._config = {}  # Last loaded or saved contents of CONFIG_FILE
+        self.config_loaded.connect(self.apply_config)
+        self.config_error.connect(self.log)
         self.load_config()
 
     def load_config(self):
-        """Load saved configuration including email"""
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    if 'email' in config:
-                        self.input_email.setText(config['email'])
-            except Exception as e:
-                self.log(f"[Warning] Could not load configuration: {str(e)}")
+        """Load saved configuration including email, off the GUI thread"""
+        future = config.run_io(config.load_config, CONFIG_FILE)
+        future.add_done_callback(lambda f: self.config_io_done(f, "load"))
 
-    def save_config(self):
-        """Save configuration including email"""
+    def config_io_done(self, future, action):
+        """Report a finished config read or write back to the GUI thread"""
         try:
-            config = {
-                'email': self.input_email.text().strip()
-            }
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f)
+            result = future.result()
         except Exception as e:
-            self.log(f"[Warning] Could not save configuration: {str(e)}")
+            self.config_error.emit(f"[Warning] Could not {action} configuration: {str(e)}")
+            return
+        if result is False:
+            # save_config reports a failed write by returning False
+            self.config_error.emit(f"[Warning] Could not {action} configuration.")
+            return
+        if action == "load":
+            self.config_loaded.emit(result)
+
+    def apply_config(self, cfg):
+        """Fill in the loaded email unless the user has already typed one"""
+        # Anything saved since the load started is newer than the file
+        self._config = {**cfg, **self._config}
+        if 'email' in cfg and not self.input_email.text():
+            self.input_email.setText(cfg['email'])
+
+    def save_config(self):
+        """Save configuration including email; config.save_config skips the write if unchanged"""
+        data = {**self._config, 'email': self.input_email.text().strip()}
+        self._config = data
+        future = config.run_io(config.save_config, CONFIG_FILE, data)
+        future.add_done_callback(lambda f: self.config_io_done(f, "save"))
     
     def reset_email(self):
         """Reset stored email"""
@@ -311,7 +316,24 @@ class SharedDriveTab(QWidget):
         self.log("\n[Info] Email address reset. Please enter a new email address.")
 
     def log(self, text):
-        self.log_area.append(text)
+        """Queue text for the log area; queued lines are written in one go"""
+        self._log_buffer.append(text)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(LOG_FLUSH_MS, self.flush_log)
+
+    def flush_log(self):
+        """Write all queued log lines with a single append"""
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
+        self.log_area.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
+
+    def clear_log(self):
+        """Clear the log area along with any lines not yet written"""
+        self._log_buffer.clear()
+        self.log_area.clear()
 
     def handle_workflow(self):
         """Handle the workflow start button click"""
@@ -321,9 +343,10 @@ class SharedDriveTab(QWidget):
         self.do_copy = "Yes" if self.copy_checkbox.isChecked() else "No"
         
         # Clean up previous states
-        self.log_area.clear()
+        self.clear_log()
+        self.closing = False
         self.drive_ids = {}
-        self.main_members = []
+        self.main_members = {}
         self.processed_count = 0
         self.total_addresses = 0
         self.processed_pairs = 0
@@ -345,11 +368,66 @@ class SharedDriveTab(QWidget):
         # Start the workflow
         self.log(f"\nStarting workflow for base drive '{self.base_drive_name}' with user {self.user_email}")
         
-        # Create the main shared drive
-        self.create_shared_drive("main", "", self.do_copy, next_step=self.after_main_created)
+        # Which drives to create is settled before anything runs, so that
+        # all of them can be created at once. External and GDPR drives are
+        # only offered alongside the folder template.
+        drives = {"main": ""}
+        self.same_members = {}
+        if self.do_copy == "Yes":
+            for label, modifier, title, name in (
+                    ("external", " (External)", "External Drive?", "an external drive"),
+                    ("gdpr", " (GDPR)", "GDPR Drive?", "a GDPR drive")):
+                same = self.ask_extra_drive(title, name)
+                if same is not None:
+                    drives[label] = modifier
+                    self.same_members[label] = same
+        self.create_drives(drives)
+
+    def ask_extra_drive(self, title, name):
+        """
+        Ask whether to create the external or GDPR drive and, if so, whether
+        it gets the main drive's members. Returns that answer, or None if the
+        drive is not wanted.
+        """
+        yes = CustomYesNoDialog.ask(title, f"Create {name}?", parent=self)
+        if not yes:
+            self.log(f"\nNot creating {name.split(' ', 1)[1]}.")
+            return None
+        return CustomYesNoDialog.ask(
+            "Use same membership?",
+            "Use the same members & roles as the main drive?\n"
+            "\nYes = Add the exact same users and roles (additional members can be added after)\n"
+            "\nNo = Add a different set of users.",
+            parent=self
+        )
 
-    def create_shared_drive(self, drive_type, modifier, do_copy, next_step=None):
-        """Create a Google Shared Drive based on the provided parameters"""
+    def create_drives(self, drives):
+        """
+        Create every drive in drives ({label: name modifier}) side by side
+        on the thread pool. Members are only asked for once all of the
+        creations have finished; the template copy onto the main drive
+        carries on in the background meanwhile.
+        """
+        self.pending_drives = set(drives)
+        for drive_type, modifier in drives.items():
+            do_copy = self.do_copy if drive_type == "main" else ""
+            self.create_shared_drive(drive_type, modifier, do_copy, self.drive_created)
+
+    def drive_created(self, drive_type):
+        """Note a finished drive creation, successful or not"""
+        self.pending_drives.discard(drive_type)
+        if not self.pending_drives:
+            # Set now so the task's cleanup does not re-enable Start, then
+            # leave its signal handler before the member dialogs open
+            self.adding_members = True
+            QTimer.singleShot(0, self.add_drive_members)
+
+    def create_shared_drive(self, drive_type, modifier, do_copy, on_done):
+        """
+        Create a Google Shared Drive based on the provided parameters, then
+        call on_done(drive_type). A template copy onto the main drive is
+        started at that point but not waited for.
+        """
         self.btn_start.setEnabled(False)
         
         # Determine the drive name - ensure valid drive names
@@ -368,15 +446,13 @@ class SharedDriveTab(QWidget):
         def creation_done(rc, lines):
             if rc != 0:
                 self.log(f"\n[Error] 'create teamdrive' command for the {drive_type} drive failed.")
-                if next_step:
-                    self.set_next_step(next_step)
+                on_done(drive_type)
                 return
             
             drive_id = self.parse_drive_id(lines)
             if not drive_id:
                 self.log(f"\n[Error] Could not parse the {drive_type} drive ID.")
-                if next_step:
-                    self.set_next_step(next_step)
+                on_done(drive_type)
                 return
             
             self.drive_ids[drive_type] = drive_id
@@ -384,25 +460,20 @@ class SharedDriveTab(QWidget):
             
             if drive_type == "main" and do_copy == "Yes":
                 self.log("\nCopying folder structure template to the main drive...")
-                self.copy_folder_contents(drive_id, next_step)
-            else:
-                if next_step:
-                    self.set_next_step(next_step)
+                self.copy_folder_contents(drive_id)
+            on_done(drive_type)
         
         self.run_threaded_command(cmd, creation_done)
 
-    def copy_folder_contents(self, drive_id, next_step):
+    def copy_folder_contents(self, drive_id):
         """
-        Copy contents directly from Internal folder to root of the drive using
-        a temporary CSV file approach to bypass ownership restrictions:
-        
-        1. Copy the entire Internal folder to the drive first
-        2. Then we'll get all its contents and move them to the root
-        3. Finally delete the copied Internal folder
+        Copy the contents of the Internal template folder to the root of the
+        drive. 'mergewithparent' makes GAM copy what is inside the folder
+        straight into the drive, rather than copying the folder itself and
+        then moving its children out and deleting it.
         """
-        self.log("\nCopying template folder to drive...")
+        self.log("\nCopying template folder contents to drive root...")
         
-        # Step 1: Copy the Internal folder to the new drive (this bypasses the ownership limitations)
         cmd = [
             GAM_PATH, "user", self.user_email,
             "copy", "drivefile", INTERNAL_FOLDER_ID,
@@ -410,140 +481,36 @@ class SharedDriveTab(QWidget):
             "copytopfolderpermissions", "false", 
             "copyfilepermissions", "false",
             "copysubfolderpermissions", "false",
-            "teamdriveparentid", drive_id
+            "teamdriveparentid", drive_id,
+            "mergewithparent", "true"
         ]
         
         def after_folder_copy(rc, lines):
             if rc != 0:
                 self.log("\n[Error] Failed to copy the template folder.")
-                if next_step:
-                    self.set_next_step(next_step)
-                return
-            
-            # Extract the ID of the copied folder
-            copied_folder_id = None
-            for line in lines:
-                match = re.search(r"id: (\S+)", line)
-                if match:
-                    copied_folder_id = match.group(1)
-                    break
-            
-            if not copied_folder_id:
-                self.log("\n[Error] Could not identify copied folder ID.")
-                if next_step:
-                    self.set_next_step(next_step)
-                return
-            
-            self.log(f"\nTemplate folder copied with ID: {copied_folder_id}")
-            
-            # Step 2: List contents of the copied folder (now we own this copy)
-            self.log("\nListing contents of copied folder...")
-            self.list_copied_contents(copied_folder_id, drive_id, next_step)
-        
-        self.run_threaded_command(cmd, after_folder_copy)
-
-    def list_copied_contents(self, folder_id, drive_id, next_step):
-        """List contents of the copied folder"""
-        cmd = [
-            GAM_PATH, "user", self.user_email,
-            "show", "filelist",
-            "query", f"'{folder_id}' in parents",
-            "fields", "id,name"
-        ]
-        
-        def process_contents(rc, lines):
-            if rc != 0:
-                self.log("\n[Error] Failed to list contents of copied folder.")
-                if next_step:
-                    self.set_next_step(next_step)
-                return
-            
-            # Parse contents
-            items = []
-            for line in lines:
-                id_match = re.search(r"id: (\S+)", line)
-                name_match = re.search(r"name: (.+)$", line)
-                if id_match and name_match:
-                    item_id = id_match.group(1)
-                    name = name_match.group(1).strip()
-                    items.append((item_id, name))
-            
-            if not items:
-                self.log("\n[Warning] Copied folder appears to be empty.")
-                # Delete the empty folder
-                self.delete_template_folder(folder_id, drive_id, next_step)
-                return
-            
-            self.log(f"\nFound {len(items)} items in the copied folder.")
-            # Move each item to the drive root
-            self.move_items_to_root(items, folder_id, drive_id, next_step)
-        
-        self.run_threaded_command(cmd, process_contents)
-
-    def move_items_to_root(self, items, folder_id, drive_id, next_step):
-        """Move items from the copied folder to the drive root"""
-        self.move_count = 0
-        self.total_items = len(items)
-        
-        for item_id, name in items:
-            self.log(f"\nMoving '{name}' to drive root...")
-            cmd = [
-                GAM_PATH, "user", self.user_email,
-                "update", "drivefile", item_id,
-                "teamdriveparent", drive_id,
-                "removeparent", folder_id
-            ]
-            
-            def after_move(rc, lines, item_name=name):
-                self.move_count += 1
-                
-                if rc != 0:
-                    self.log(f"\n[Warning] Failed to move '{item_name}' to root.")
-                else:
-                    self.log(f"\nSuccessfully moved '{item_name}' to root.")
-                
-                # Once all items are moved, delete the template folder
-                if self.move_count >= self.total_items:
-                    self.delete_template_folder(folder_id, drive_id, next_step)
-            
-            self.run_threaded_command(cmd, after_move)
-
-    def delete_template_folder(self, folder_id, drive_id, next_step):
-        """Delete the template folder after moving its contents"""
-        self.log("\nDeleting the copied template folder (contents already moved to root)...")
-        
-        cmd = [
-            GAM_PATH, "user", self.user_email,
-            "delete", "drivefile", folder_id
-        ]
-        
-        def after_delete(rc, lines):
-            if rc != 0:
-                self.log("\n[Warning] Could not delete the template folder.")
             else:
-                self.log("\nTemplate folder deleted.")
-            
-            self.log("\nFolder structure successfully copied to drive root.")
-            if next_step:
-                self.set_next_step(next_step)
+                self.log("\nFolder structure successfully copied to drive root.")
         
-        self.run_threaded_command(cmd, after_delete)
+        self.run_threaded_command(cmd, after_folder_copy)
 
     def log_output(self, text):
-        """Log output from the worker thread"""
+        """Log output from a GAM task"""
         self.log(text)
 
     def cleanup_thread(self, worker):
-        """Remove the thread from our tracking list once it's done"""
+        """Remove the task from our tracking list once it's done"""
         if worker in self.workers:
-            self.workers.remove(worker)
+            self.workers.discard(worker)
+            worker.signals.deleteLater()
             self.command_finished()
 
     def command_finished(self):
         """Process command completion and handle next steps"""
         if not self.workers:
-            # Only enable the button if we're at the end of a workflow
-            if not hasattr(self, 'next_step') or self.next_step is None:
+            # Only enable the button if we're at the end of a workflow; the
+            # template copy can finish while members are still being entered
+            if (not hasattr(self, 'next_step') or self.next_step is None) and \
+                    not self.adding_members:
                 self.btn_start.setEnabled(True)
                 
             # Call next_step if available - important to do this before returning
@@ -551,11 +518,10 @@ class SharedDriveTab(QWidget):
 
     def parse_drive_id(self, lines):
         """Parse the drive ID from command output"""
-        for line in lines:
-            m = re.search(r"Shared Drive ID:\s*(\S+)", line)
-            if m:
-                return m.group(1).rstrip(',')
-        return ""
+        # One search over the whole output finds the first match, as the
+        # ID cannot span lines
+        m = _DRIVE_ID_RE.search("\n".join(lines))
+        return m.group(1).rstrip(',') if m else ""
 
     def set_next_step(self, next_step):
         """Set the next step to execute and schedule it if no workers are active"""
@@ -572,69 +538,35 @@ class SharedDriveTab(QWidget):
             self.next_step = None  # Clear to prevent multiple executions
             next_step()
 
-    def after_main_created(self):
-        """Handle workflow after main drive is created"""
+    def add_drive_members(self):
+        """Ask for and add the members of each drive that was created"""
         main_id = self.drive_ids.get("main")
-        if not main_id:
+        if main_id:
+            self.log("\nNow add members to the main drive.")
+            self.bulk_add_members(drive_id=main_id, store_in_main=True, label="main")
+        else:
             self.log("\n[Error] No main drive ID found, skipping membership.")
-            if self.do_copy == "Yes":
-                self.ask_external_drive()
+
+        for label, use_same in self.same_members.items():
+            if self.closing:
+                return
+            drive_id = self.drive_ids.get(label)
+            if not drive_id:
+                self.log(f"\n[Error] No {label} drive ID found.")
+            elif use_same and self.main_members:
+                self.log(f"\nRe-adding main drive members to the {label} drive...")
+                self.re_add_members(label, drive_id)
             else:
-                self.end_workflow()
-            return
+                self.log(f"\nNew membership flow for the {label} drive...")
+                self.bulk_add_members(drive_id=drive_id, store_in_main=False, label=label)
+        self.adding_members = False
 
-        self.log("\nNow add members to the main drive.")
-        self.bulk_add_members(drive_id=main_id, store_in_main=True, label="main", next_step=self.decide_post_main)
-        
-    def decide_post_main(self):
-        """Decide what to do after main drive setup is complete"""
-        if self.do_copy == "Yes":
-            self.ask_external_drive()
-        else:
-            self.end_workflow()
+        # The template copy runs as the user, so they are only offered
+        # removal from the drives once it has finished
+        if self.workers:
+            self.log("\nWaiting for the template copy to finish...")
+        self.set_next_step(self.end_workflow)
 
-    def ask_external_drive(self):
-        """Ask if user wants to create an external drive"""
-        yes = CustomYesNoDialog.ask(
-            "External Drive?",
-            "Create an external drive?",
-            parent=self
-        )
-        if yes:
-            same = CustomYesNoDialog.ask(
-                "Use same membership?",
-                "Use the same members & roles as the main drive?\n"
-                "\nYes = Add the exact same users and roles (additional members can be added after)\n"
-                "\nNo = Add a different set of users.",
-                parent=self
-            )
-            self.create_shared_drive("external", " (External)", "",
-                                     next_step=lambda: self.after_external_created(same))
-        else:
-            self.log("\nNot creating external drive.")
-            self.ask_gdpr_drive()
-            
-    def ask_gdpr_drive(self):
-        """Ask if user wants to create a GDPR drive"""
-        yes = CustomYesNoDialog.ask(
-            "GDPR Drive?",
-            "Create a GDPR drive?",
-            parent=self
-        )
-        if yes:
-            same = CustomYesNoDialog.ask(
-                "Use same membership?",
-                "Use the same members & roles as the main drive?\n"
-                "\nYes = Add the exact same users and roles (additional members can be added after)\n"
-                "\nNo = Add a different set of users.",
-                parent=self
-            )
-            self.create_shared_drive("gdpr", " (GDPR)", "",
-                                     next_step=lambda: self.after_gdpr_created(same))
-        else:
-            self.log("\nNot creating GDPR drive.")
-            self.end_workflow()
-            
     def end_workflow(self):
         """End the workflow and ask about removing self"""
         self.ask_remove_self()
@@ -658,38 +590,28 @@ class SharedDriveTab(QWidget):
 
     def remove_self_from_drives(self, next_step):
         """Remove the user from all created drives"""
-        drive_count = len(self.drive_ids)
-        self.processed_count = 0
-        
+        commands = []
         for label, drive_id in self.drive_ids.items():
             self.log(f"\nRemoving {self.user_email} from {label} drive ({drive_id})...")
-            cmd = [
-                GAM_PATH,
-                "delete", "drivefileacl", drive_id,
-                self.user_email
-            ]
-            
-            # Create worker before defining callback
-            worker = WorkerThread(cmd)
-            
-            def removal_done(rc, lines, current_label=label, w=worker):
-                # Don't call cleanup here as it will be called by the finished signal
-                self.processed_count += 1
-                
-                if rc != 0:
-                    self.log(f"\n[Warning] Could not remove {self.user_email} from {current_label} drive.")
-                else:
-                    self.log(f"\nSuccessfully removed {self.user_email} from {current_label} drive.")
-                
-                if self.processed_count >= drive_count and next_step:
-                    self.set_next_step(next_step)
+            commands.append(["delete", "drivefileacl", drive_id, self.user_email])
+        
+        if not commands:
+            if next_step:
+                self.set_next_step(next_step)
+            return
+        
+        def removal_done(rc, lines):
+            if rc != 0:
+                self.log(f"\n[Warning] Could not remove {self.user_email} from one or more drives.")
+            else:
+                self.log(f"\nSuccessfully removed {self.user_email} from {len(commands)} drive(s).")
             
-            # Connect signals consistently
-            worker.line_signal.connect(self.log_output)
-            worker.done_signal.connect(removal_done)
-            worker.finished.connect(lambda w=worker: self.cleanup_thread(w))
-            worker.start()
-            self.workers.append(worker)
+            if next_step:
+                self.set_next_step(next_step)
+        
+        # The removals are independent, so GAM runs them side by side in one
+        # process rather than one process per drive
+        self.run_gam_batch(commands, removal_done)
 
     def display_drive_urls(self):
         """Display URLs for all created drives"""
@@ -700,7 +622,10 @@ class SharedDriveTab(QWidget):
         self.log("\n" + "="*50)
         self.log("\nSUMMARY OF CREATED DRIVES:")
         
-        for label, drive_id in self.drive_ids.items():
+        # The drives are created side by side, so list them in a fixed order
+        # rather than the order they finished in
+        for label in sorted(self.drive_ids, key=("main", "external", "gdpr").index):
+            drive_id = self.drive_ids[label]
             drive_name = f"{self.base_drive_name}{' (External)' if label == 'external' else ' (GDPR)' if label == 'gdpr' else ''}"
             drive_url = f"https://drive.google.com/drive/folders/{drive_id}"
             self.log(f"\n{drive_name}:")
@@ -712,139 +637,139 @@ class SharedDriveTab(QWidget):
 
     def show_warning(self, title, message):
         """Show a single-button OK dialog with branding icon."""
-        dlg = QDialog(self)
-        dlg.setWindowTitle(title)
-        dlg.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
-        layout = QVBoxLayout(dlg)
-
-        lbl = QLabel(message)
-        lbl.setWordWrap(True)
-        layout.addWidget(lbl)
-
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok)
-        buttons.accepted.connect(dlg.accept)
-        layout.addWidget(buttons)
-
-        dlg.exec_()
+        # Qt's stock dialog; it takes the branding icon from the application
+        QMessageBox.warning(self, title, message)
 
     def closeEvent(self, event):
-        for w in self.workers:
-            if w.isRunning():
-                self.log("\n[Info] Waiting for a background thread to finish...")
-                w.wait(2000)
-                if w.isRunning():
-                    self.log("\n[Warning] Forcibly terminating leftover thread.")
-                    w.terminate()
+        # The workflow stops at its next step instead of opening more dialogs
+        self.closing = True
+        self.next_step = None
+        # This tab's tasks that have not started yet are dropped; running ones
+        # are cancelled, which stops their GAM process. The pool is shared, so
+        # other tools' tasks carry on.
+        cancel_tasks(self.workers)
+        # A blocking command's local loop returns once this handler does
+        for loop in self.blocking_loops:
+            loop.quit()
+        if self.workers:
+            self.log("\n[Info] Waiting for background tasks to finish...")
+            if not wait_for_tasks(self.workers, 2000):
+                self.log("\n[Warning] Background tasks are still running.")
         super().closeEvent(event)
 
     def save_settings(self):
         """Save current settings to config file"""
         config.save_config(config.DRIVE_CONFIG, self.settings)
 
-    def run_threaded_command(self, cmd_list, callback):
-        """Run a GAM command in a thread with proper callback handling"""
-        worker = WorkerThread(cmd_list)
-        self.workers.append(worker)
+    def run_threaded_command(self, cmd_list, callback, stdin_data=None):
+        """Run a GAM command on the thread pool with proper callback handling"""
+        worker = GamRunnable(cmd_list, stdin_data=stdin_data)
+        self.workers.add(worker)
 
         # Connect to log_output method, not directly to log
-        worker.line_signal.connect(self.log_output)
+        worker.signals.line_signal.connect(self.log_output, Qt.QueuedConnection)
+        worker.signals.done_signal.connect(callback)
+        worker.signals.finished.connect(lambda w=worker: self.cleanup_thread(w))
+        gam_pool().start(worker)
 
-        def on_done(rc, lines):
-            callback(rc, lines)
-
-        worker.done_signal.connect(on_done)
-        
-        # Use a proper lambda to capture worker
-        worker.finished.connect(lambda w=worker: self.cleanup_thread(w))
-        worker.start()
+    def run_gam_batch(self, commands, callback):
+        """
+        Run several independent GAM commands, each a list of the arguments
+        after 'gam', in a single 'gam tbatch -' process. GAM starts and
+        authenticates once and runs the commands on its own threads; the
+        callback gets one returncode for the whole batch.
+        """
+        stdin_data = "".join(shlex.join(["gam", *args]) + "\n" for args in commands)
+        self.run_threaded_command([GAM_PATH, "tbatch", "-"], callback, stdin_data)
 
-    def run_blocking_command(self, cmd_list):
-        """Run a GAM command and block until it completes"""
-        try:
-            proc = subprocess.Popen(cmd_list, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-            out, err = proc.communicate()
-            if out:
-                for line in out.splitlines():
-                    self.log(line)
-            if err:
-                for e_line in err.splitlines():
-                    self.log(f"\n{e_line}")
-        except Exception as e:
-            self.log(f"\n[Exception] {str(e)}")
-
-    def get_current_drive_type(self, command):
-        """Extract drive type from the command context"""
-        if 'External' in command:
-            return 'external'
-        elif 'GDPR' in command:
-            return 'gdpr'
-        else:
-            return 'main'
-        
-    def handle_drive_creation(self, rc, lines, drive_type):
-        """Handle the completion of a drive creation command"""
-        if rc != 0:
-            self.log(f"\n[Error] 'create teamdrive' command for the {drive_type} drive failed.")
-            return
-            
-        new_id = self.parse_drive_id(lines)
-        if not new_id:
-            self.log(f"\n[Error] Could not parse the {drive_type} drive ID.")
-            return
-            
-        self.drive_ids[drive_type] = new_id
-        self.log(f"\nDrive '{drive_type}' created successfully. ID={new_id}")
-        
-        # For main drive with copy template option
-        if drive_type == "main" and hasattr(self, 'do_copy') and self.do_copy == "Yes":
-            self.log("\nCopying folder structure template to the main drive...")
-            # Add template folder ID to config
-            self.copy_folder_contents(new_id, INTERNAL_FOLDER_ID)
-            
-    def after_external_created(self, use_same):
-        """Handle workflow after external drive is created"""
-        external_id = self.drive_ids.get("external")
-        if not external_id:
-            self.log("\n[Error] No external drive ID found.")
-            self.ask_gdpr_drive()
-            return
+    def run_blocking_command(self, cmd_list, capture=True, stdin_data=None):
+        """
+        Run a GAM command and wait until it completes, returning
+        (returncode, lines). The command runs on the thread pool while a local
+        event loop keeps the window responsive and logs output as it arrives.
+        With capture=False the output is only logged and lines is empty.
+        The returncode is also non-zero if any output line reported a
+        failure, since 'gam csv' exits 0 when only some of its rows fail.
+        """
+        result = []
+        loop = QEventLoop()
+        worker = GamRunnable(cmd_list, capture, stdin_data)
+        self.workers.add(worker)
+        worker.signals.line_signal.connect(self.log_output, Qt.QueuedConnection)
+        worker.signals.done_signal.connect(lambda rc, lines: result.extend((rc, lines)))
+        worker.signals.finished.connect(lambda: self.blocking_task_done(worker, loop))
+        self.blocking_loops.add(loop)
+        gam_pool().start(worker)
+        loop.exec_()
+        self.blocking_loops.discard(loop)
+        worker.signals.deleteLater()
+        if self.closing or not result:
+            return 1, []
+        rc, lines = result
+        return (rc or int(worker.error_lines > 0)), lines
+
+    def blocking_task_done(self, worker, loop):
+        """
+        Forget a run_blocking_command task as soon as it finishes. It is
+        removed here, not once loop.exec_() returns, so that closeEvent's
+        wait, which runs on top of the local loop, sees it go. It is also
+        removed without cleanup_thread, so the caller's workflow carries on
+        rather than the next step being scheduled.
+        """
+        self.workers.discard(worker)
+        loop.quit()
 
-        if use_same and self.main_members:
-            self.log("\nRe-adding main drive members to the external drive...")
-            self.re_add_members("external", external_id, next_step=self.ask_gdpr_drive)
-        else:
-            self.log("\nNew membership flow for the external drive...")
-            self.bulk_add_members(drive_id=external_id, store_in_main=False, label="external", next_step=self.ask_gdpr_drive)
-        
-    def after_gdpr_created(self, use_same):
-        """Handle workflow after GDPR drive is created"""
-        gdpr_id = self.drive_ids.get("gdpr")
-        if not gdpr_id:
-            self.log("\n[Error] No gdpr drive ID found.")
-            self.end_workflow()
+    def run_gam_csv(self, fieldnames, rows, gam_args):
+        """
+        Run one GAM command template over every row with a single
+        'gam csv - gam ...' process, blocking until it completes. The rows
+        are sent as CSV on stdin; gam_args refers to the columns as
+        ~fieldname. GAM_CSV_THREADS rows are in flight at once, so their
+        API round trips overlap. Returns the returncode; the output is only
+        logged.
+        """
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+        cmd = [GAM_PATH, "config", "num_threads", str(GAM_CSV_THREADS),
+               "csv", "-", "gam", *gam_args]
+        rc, _ = self.run_blocking_command(cmd, capture=False, stdin_data=buf.getvalue())
+        return rc
+
+    def add_members_batch(self, drive_id, rows):
+        """
+        Add (address, gam_role) pairs to a drive with a single 'gam csv' run
+        rather than starting one GAM process per address.
+        """
+        if not rows:
             return
 
-        if use_same and self.main_members:
-            self.log("\nRe-adding main drive members to the gdpr drive...")
-            self.re_add_members("gdpr", gdpr_id, next_step=self.end_workflow)
-        else:
-            self.log("\nNew membership flow for the gdpr drive...")
-            self.bulk_add_members(drive_id=gdpr_id, store_in_main=False, label="gdpr", next_step=self.end_workflow)
+        rc = self.run_gam_csv(["email", "role"], rows, [
+            "user", self.user_email,
+            "add", "drivefileacl", drive_id,
+            "user", "~email", "role", "~role"
+        ])
+        if rc != 0:
+            self.log("\n[Warning] One or more members could not be added.")
 
-    def bulk_add_members(self, drive_id, store_in_main, label, next_step):
+    def bulk_add_members(self, drive_id, store_in_main, label):
         """
         Repeatedly ask for a web role + multiline addresses.
         Convert to gam role, run 'gam add drivefileacl'.
         If store_in_main, store for re-adding to external/GDPR.
         """
-        while True:
+        while not self.closing:
             web_role = SelectRoleDialog.get_role(parent=self)
             if not web_role:
                 self.log(f"\nNo more members to add to the {label} drive.")
                 break
 
-            raw_text = MultiLineAddressesDialog.get_addresses(parent=self)
-            if not raw_text.strip():
+            # The cleaned list is also what gets re-added to the other drives
+            addresses, skipped = valid_addresses(MultiLineAddressesDialog.get_addresses(parent=self))
+            if skipped:
+                self.log(f"\nSkipping invalid email addresses: {', '.join(skipped)}")
+            if not addresses:
                 self.log(f"\nNo addresses provided for the {label} drive. Skipping.")
                 question = f"Add more Members to the {label} drive?"
                 more = CustomYesNoDialog.ask(f"Add More Members to the {label} drive?", question, parent=self)
@@ -853,63 +778,53 @@ class SharedDriveTab(QWidget):
                 else:
                     continue
 
-            replaced = raw_text.replace(",", " ")
-            addresses = [x.strip() for x in replaced.split() if x.strip()]
-
-            gam_role = WEB_TO_GAM[web_role]
             for addr in addresses:
                 self.log(f"\nAdding {addr} as {web_role} to the {label} drive...")
-                cmd = [
-                    GAM_PATH, "user", self.user_email,
-                    "add", "drivefileacl", drive_id,
-                    "user", addr, "role", gam_role
-                ]
-                self.run_blocking_command(cmd)
+            self.add_members_batch(drive_id, [(addr, WEB_TO_GAM[web_role]) for addr in addresses])
+            if self.closing:
+                break
 
             if store_in_main:
-                self.main_members.append((web_role, addresses))
+                self.main_members.setdefault(web_role, set()).update(addresses)
 
             question = f"Add more members to the {label} drive?"
             more_roles = CustomYesNoDialog.ask(f"Add More Members to the {label} drive?", question, parent=self)
             if not more_roles:
                 break
 
-        if next_step:
-            self.set_next_step(next_step)
-
-    def re_add_members(self, label, drive_id, next_step):
+    def re_add_members(self, label, drive_id):
         """Re-add members from main drive to another drive"""
         if not self.main_members:
             self.log(f"\n[Warning] No stored main membership found for the {label} drive.")
-            if next_step:
-                self.set_next_step(next_step)
             return
 
-        for (web_role, addresses) in self.main_members:
+        # An address entered under several roles is re-added once, with the
+        # highest of them; WEB_ROLE_LIST runs from most to least access
+        rows = []
+        seen = set()
+        for web_role in WEB_ROLE_LIST:
+            addresses = self.main_members.get(web_role, set()) - seen
             gam_role = WEB_TO_GAM[web_role]
-            for addr in addresses:
+            for addr in sorted(addresses):
                 self.log(f"\nRe-adding {addr} as {web_role} to the {label} drive...")
-                cmd = [
-                    GAM_PATH, "user", self.user_email,
-                    "add", "drivefileacl", drive_id,
-                    "user", addr, "role", gam_role
-                ]
-                self.run_blocking_command(cmd)
+                rows.append((addr, gam_role))
+            seen |= addresses
+        self.add_members_batch(drive_id, rows)
+        if self.closing:
+            return
 
         question = f"Add additional new members for the {label} drive?"
         more = CustomYesNoDialog.ask("Additional members?", question, parent=self)
         if more:
-            self.bulk_add_members(drive_id=drive_id, store_in_main=False, label=label, next_step=next_step)
-        else:
-            if next_step:
-                self.set_next_step(next_step)
+            self.bulk_add_members(drive_id=drive_id, store_in_main=False, label=label)
 
 def standalone():
     """Run this tool as a standalone application"""
+    from PyQt5.QtWidgets import QApplication
     app = QApplication(sys.argv)
-    app.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
     w = SharedDriveTab()
     w.show()
+    set_app_icon_later(app)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Branding images shared by the ustwo IT Tools windows and dialogs.
+
+The icns file is decoded on first use and then reused, so opening a dialog
+does not re-read and re-scale it. Nothing is loaded at import time because
+Qt pixmaps need a QApplication to exist first, and the application icon is
+only set once the first window is up.
+"""
+
+import functools
+import os
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QPixmap, QIcon
+
+# Branding image deployed to managed Macs by JAMF
+JAMF_ICON_PATH = "/Library/JAMF/Icon/brandingimage.icns"
+
+# Size of the logo shown at the top of each tool
+LOGO_SIZE = 128
+
+_icon = None
+
+@functools.lru_cache(maxsize=None)
+def has_branding():
+    """Whether the JAMF branding image is installed; checked once per process"""
+    return os.path.exists(JAMF_ICON_PATH)
+
+def branding_icon():
+    """Return the branding window icon, or a null icon on non-JAMF machines"""
+    global _icon
+    if _icon is None:
+        _icon = QIcon(JAMF_ICON_PATH) if has_branding() else QIcon()
+    return _icon
+
+def set_app_icon_later(app):
+    """
+    Give app the branding icon on the next pass of the event loop, so the
+    icns is decoded after the first window has been painted rather than
+    before. Every window and dialog inherits the application icon.
+    """
+    QTimer.singleShot(0, lambda: app.setWindowIcon(branding_icon()))
+
+@functools.lru_cache(maxsize=8)
+def branding_logo(size=LOGO_SIZE):
+    """Return the branding image scaled to fit a size x size square"""
+    if not has_branding():
+        return QPixmap()
+    pixmap = QPixmap(JAMF_ICON_PATH)
+    return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
@@ -4,8 +4,10 @@ Configuration settings for ustwo IT Tools
 """
 
 import os
+import copy
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Application paths
@@ -28,7 +30,7 @@ logging.basicConfig(
 )
 
 # GAM path - can be overridden by environment variable
-GAM_PATH = os.getenv("GAM_PATH", os.path.expanduser("~/bin/gam7/gam"))
+GAM_PATH = os.path.expanduser(os.getenv("GAM_PATH", "~/bin/gam7/gam"))
 
 # Config file paths
 SHARED_CONFIG = os.path.join(APP_DIR, "config", "shared_config.json")
@@ -40,25 +42,62 @@ OFFBOARD_CONFIG = os.path.join(APP_DIR, "config", "offboard_config.json")
 os.makedirs(ASSETS_DIR, exist_ok=True)
 os.makedirs(os.path.dirname(SHARED_CONFIG), exist_ok=True)
 
+# Parsed configs keyed by path: (st_mtime_ns, data, serialized bytes)
+_cache = {}
+
+def _mtime_ns(path):
+    """Return the modification time of path, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 def load_config(config_file):
-    """Load configuration from a JSON file"""
+    """Load configuration from a JSON file, reusing the cached copy if unchanged"""
     try:
-        if os.path.exists(config_file):
-            with open(config_file, 'r') as f:
-                return json.load(f)
+        mtime = _mtime_ns(config_file)
+        if mtime is not None:
+            cached = _cache.get(config_file)
+            if cached is None or cached[0] != mtime:
+                with open(config_file, 'rb') as f:
+                    raw = f.read()
+                cached = (mtime, json.loads(raw), raw)
+                _cache[config_file] = cached
+            # Callers modify the settings they get back, so hand out a copy
+            return copy.deepcopy(cached[1])
+    except FileNotFoundError:
+        pass
     except Exception as e:
         print(f"[Warning] Could not load configuration: {str(e)}")
     return {}
 
 def save_config(config_file, data):
-    """Save configuration to a JSON file"""
+    """Save configuration to a JSON file, skipping the write if nothing changed"""
     try:
-        with open(config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = json.dumps(data, indent=2).encode()
+        cached = _cache.get(config_file)
+        if cached is not None and cached[2] == payload and _mtime_ns(config_file) == cached[0]:
+            return True
+        # Write to a temporary file and swap it in so the config is never
+        # left half-written
+        tmp_file = config_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, config_file)
+        _cache[config_file] = (os.stat(config_file).st_mtime_ns, copy.deepcopy(data), payload)
         return True
     except Exception as e:
         print(f"[Warning] Could not save configuration: {str(e)}")
         return False
 
+# Tool settings are read and written on one background thread, with
+# load_config and save_config, so a slow home directory never stalls the
+# GUI; a single worker keeps writes in order
+_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-io")
+
+def run_io(func, *args):
+    """Run func(*args) on the config I/O thread and return its Future"""
+    return _io_executor.submit(func, *args)
+
 # Load shared configuration
 shared_config = load_config(SHARED_CONFIG) 
\ No newline at end of file
@@ -4,13 +4,13 @@ Shared Drive Tab for ustwo IT Tools
 """
 
 from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLabel,
     QLineEdit, QPushButton, QTextEdit, QCheckBox, QDialog, QDialogButtonBox,
     QScrollArea
 )
 from . import config
+from .branding import branding_icon, branding_logo
 import os
 import json
 
@@ -47,9 +47,7 @@ class SharedDriveTab(QWidget):
 
         # Logo
         self.logo_label = QLabel()
-        pixmap = QPixmap("/Library/JAMF/Icon/brandingimage.icns")
-        scaled = pixmap.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self.logo_label.setPixmap(scaled)
+        self.logo_label.setPixmap(branding_logo())
         top_hbox.addWidget(self.logo_label)
 
         # Right side inputs
@@ -209,7 +207,7 @@ class SharedDriveTab(QWidget):
         """Show a warning dialog"""
         dlg = QDialog(self)
         dlg.setWindowTitle(title)
-        dlg.setWindowIcon(QIcon("/Library/JAMF/Icon/brandingimage.icns"))
+        dlg.setWindowIcon(branding_icon())
         layout = QVBoxLayout(dlg)
 
         lbl = QLabel(message)
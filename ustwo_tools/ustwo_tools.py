@@ -3,14 +3,22 @@
 Main application module for ustwo IT Tools
 """
 
+import importlib
+import os
 import sys
 import logging
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout
+from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget, QMessageBox, QWidget
 
 from . import config
-from . import Create_Group
-from . import Shared_Drive
-from . import Offboarding
+from .branding import set_app_icon_later
+
+# (module, class, tab label) of each tool. A tool's module is imported and
+# its tab built the first time the tab is shown.
+TOOLS = (
+    ("Create_Group", "CreateGroupTab", "Create Group"),
+    ("Shared_Drive", "SharedDriveTab", "Shared Drive"),
+    ("Offboarding", "OffboardingTab", "Offboarding"),
+)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -22,20 +30,47 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
         
-        # Create tabs
-        self.create_group_tab = Create_Group.CreateGroupTab()
-        self.shared_drive_tab = Shared_Drive.SharedDriveTab()
-        self.offboarding_tab = Offboarding.OffboardingTab()
-        
-        # Add tabs
-        self.tabs.addTab(self.create_group_tab, "Create Group")
-        self.tabs.addTab(self.shared_drive_tab, "Shared Drive")
-        self.tabs.addTab(self.offboarding_tab, "Offboarding")
+        # Add a placeholder for each tool; main() builds the first one once
+        # the window is on screen
+        self._loaded = set()
+        for _, _, label in TOOLS:
+            self.tabs.addTab(QWidget(), label)
+        self.tabs.currentChanged.connect(self.load_tab)
+
+    def load_tab(self, index):
+        """Swap the placeholder at index for its tool the first time it is shown"""
+        if index < 0 or index in self._loaded:
+            return
+        self._loaded.add(index)
+        module_name, class_name, label = TOOLS[index]
+        module = importlib.import_module(f".{module_name}", __package__)
+        tool = getattr(module, class_name)()
+        placeholder = self.tabs.widget(index)
+        # Removing the current tab would select, and so load, a neighbour
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tool, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
 
 def main():
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    # Paint the empty window before any tool is imported or built, so
+    # something is on screen straight away
+    app.processEvents()
+    from . import Create_Group
+    app.setStyleSheet(Create_Group.EXTERNAL_TOGGLE_QSS)
+    window.load_tab(window.tabs.currentIndex())
+    set_app_icon_later(app)
+    # Checked once here; the tools assume GAM is present and only report it
+    # missing if a command then fails to start
+    if not os.path.isfile(config.GAM_PATH):
+        QMessageBox.warning(window, "GAM Not Found",
+                            f"Could not find 'gam' at {config.GAM_PATH}.\n"
+                            "Set GAM_PATH or install GAM before running any tool.")
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+The thread pool shared by every tool's GAM commands, the GamRunnable task
+they run as, and the address helpers the tools have in common.
+
+All tabs queue their GAM tasks on one pool, so the combined app never has
+more than GAM_MAX_WORKERS GAM processes talking to Google at once however
+many tools are busy, and GAM_STARTS_PER_SECOND limits how quickly new ones
+are started. The pool is created on first use, after the QApplication
+exists.
+"""
+
+import functools
+import os
+import re
+import selectors
+import subprocess
+import threading
+import time
+
+from PyQt5.QtCore import QEventLoop, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+# At most this many GAM commands run at once, to stay under Google API quotas
+GAM_MAX_WORKERS = 4
+
+# GAM commands started per second across all tools. Drive allows a user
+# about 10 writes a second; commands started faster than that are only
+# slowed down again by 429 responses and GAM's retry backoff.
+GAM_STARTS_PER_SECOND = 10
+
+# GamRunnable reads GAM output in READ_SIZE chunks, waking at least every
+# READ_TIMEOUT seconds to check whether it has been cancelled
+READ_SIZE = 4096
+READ_TIMEOUT = 0.1
+
+# GAM output is sent to the log every LOG_BATCH_LINES lines or LOG_BATCH_SECONDS
+LOG_BATCH_LINES = 64
+LOG_BATCH_SECONDS = 0.016
+
+# Addresses may be separated by any mix of commas, semicolons and whitespace
+_ADDR_SPLIT_RE = re.compile(r"[\s,;]+")
+
+@functools.lru_cache(maxsize=8)
+def split_addresses(text):
+    """Split pasted text into a tuple of addresses; repeat pastes are cached"""
+    # Leading or trailing separators only produce empty strings, which are
+    # dropped, so the text does not need stripping first
+    return tuple(a for a in _ADDR_SPLIT_RE.split(text) if a)
+
+# Rough shape check so obvious typos are rejected before GAM is started
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+def valid_addresses(text):
+    """
+    Split pasted text into addresses and return (addresses, skipped).
+    Google treats addresses case-insensitively, so the well-formed ones are
+    lower-cased and each is kept once, in the order first entered; skipped
+    lists the malformed ones as typed.
+    """
+    addresses = split_addresses(text)
+    valid = list(dict.fromkeys(a.lower() for a in addresses if EMAIL_RE.match(a)))
+    skipped = [a for a in addresses if not EMAIL_RE.match(a)]
+    return valid, skipped
+
+# Matches each output line in which GAM reports a failure
+_ERROR_LINE_RE = re.compile(rb"^.*(?:Failed|Error)", re.MULTILINE)
+
+_gam_pool = None
+
+def gam_pool():
+    """Return the thread pool GAM commands run on, bounded to GAM_MAX_WORKERS"""
+    global _gam_pool
+    if _gam_pool is None:
+        _gam_pool = QThreadPool()
+        _gam_pool.setMaxThreadCount(GAM_MAX_WORKERS)
+    return _gam_pool
+
+class TokenBucket:
+    """
+    Allow up to rate events a second on average, and bursts of up to
+    capacity. Safe to share between threads.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Taken by every GAM task just before its process starts, on the pool thread
+gam_starts = TokenBucket(GAM_STARTS_PER_SECOND, GAM_STARTS_PER_SECOND)
+
+def cancel_tasks(tasks):
+    """
+    Drop tasks that are still queued and cancel the ones already running.
+    Other tools' tasks on the shared pool are left alone.
+    """
+    pool = gam_pool()
+    for task in list(tasks):
+        if pool.tryTake(task):
+            tasks.discard(task)
+        else:
+            task.cancel()
+
+def wait_for_tasks(tasks, timeout_ms):
+    """
+    Run a local event loop until tasks is empty or timeout_ms has passed,
+    and return whether it emptied. tasks is a tool's own set, which its
+    finished handlers prune, so other tools' tasks are not waited for and
+    the window keeps repainting meanwhile.
+    """
+    if not tasks:
+        return True
+    loop = QEventLoop()
+    check = QTimer()
+    check.timeout.connect(lambda: tasks or loop.quit())
+    check.start(50)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    check.stop()
+    return not tasks
+
+class WorkerSignals(QObject):
+    """Signals for a GamRunnable; created on the GUI thread so slots run there"""
+    line_signal = pyqtSignal(str)
+    done_signal = pyqtSignal(int, list)  # (returncode, all_lines)
+    finished = pyqtSignal()
+
+class GamRunnable(QRunnable):
+    """A GAM command run on the shared GAM thread pool"""
+    def __init__(self, cmd_list, capture=True, stdin_data=None):
+        super().__init__()
+        # The tab keeps a reference until finished, so Python owns the task
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.cmd_list = cmd_list
+        self.stdin_data = stdin_data
+        # Output is only kept for done_signal if the caller needs to parse it
+        self.capture = capture
+        self.captured_lines = []
+        self.error_lines = 0  # Output lines that reported a failure
+        self._batch = []  # Lines read but not yet sent to the log
+        self._last_emit = time.monotonic()
+        self.proc = None
+        self._cancel = False
+
+    def cancel(self):
+        """Stop the command; run() notices within READ_TIMEOUT seconds"""
+        self._cancel = True
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+
+    def emit_lines(self, data, prefix):
+        """Queue a block of complete output lines for the log"""
+        # One regex pass over the raw bytes of the whole block rather than
+        # a test per decoded line
+        self.error_lines += len(_ERROR_LINE_RE.findall(data))
+        text = data.decode("utf-8", errors="replace")
+        if not prefix and not self.capture:
+            # Only logged: the block already is its lines joined by newlines,
+            # so it is queued whole instead of being split and re-joined
+            self._batch.append(text)
+            return
+        lines = text.splitlines()
+        if prefix:
+            # Only stderr lines are prefixed; stdout lines are used as split
+            lines = [prefix + line for line in lines]
+        if self.capture:
+            self.captured_lines.extend(lines)
+        self._batch.extend(lines)
+
+    def flush_lines(self, force=False):
+        """Send queued lines to the log with one signal once enough have built up"""
+        if not self._batch:
+            return
+        if force or len(self._batch) >= LOG_BATCH_LINES or \
+                time.monotonic() - self._last_emit >= LOG_BATCH_SECONDS:
+            self.signals.line_signal.emit("\n".join(self._batch))
+            self._batch.clear()
+            self._last_emit = time.monotonic()
+
+    def run(self):
+        try:
+            self.run_command()
+        finally:
+            self.signals.finished.emit()
+
+    def run_command(self):
+        try:
+            # Keep the rate of new GAM commands within Drive's write quota
+            gam_starts.acquire()
+            self.proc = proc = subprocess.Popen(
+                self.cmd_list,
+                stdin=subprocess.PIPE if self.stdin_data is not None else None,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                # With close_fds off (and no new session) CPython starts GAM
+                # with posix_spawn instead of fork+exec. Nothing leaks into
+                # GAM: Python and Qt open their descriptors close-on-exec.
+                close_fds=False
+            )
+
+            # Drain stdout and stderr together without blocking, so a chatty
+            # stderr cannot fill its pipe and stall GAM and the thread can
+            # check for cancellation; stderr lines keep their "\n" prefix
+            selector = selectors.DefaultSelector()
+            pending = {}
+            for stream, prefix in ((proc.stdout, ""), (proc.stderr, "\n")):
+                fd = stream.fileno()
+                os.set_blocking(fd, False)
+                selector.register(fd, selectors.EVENT_READ, prefix)
+                pending[fd] = b""
+
+            # Any stdin data is written as the pipe accepts it, in the same
+            # loop, so GAM can never block writing output while we write input
+            if self.stdin_data is not None:
+                to_write = memoryview(self.stdin_data.encode("utf-8"))
+                os.set_blocking(proc.stdin.fileno(), False)
+                selector.register(proc.stdin.fileno(), selectors.EVENT_WRITE, None)
+
+            while selector.get_map() and not self._cancel:
+                for key, _ in selector.select(timeout=READ_TIMEOUT):
+                    if key.data is None:
+                        try:
+                            to_write = to_write[os.write(key.fd, to_write[:READ_SIZE]):]
+                        except BlockingIOError:
+                            continue
+                        except BrokenPipeError:
+                            to_write = to_write[:0]
+                        if not to_write:
+                            selector.unregister(key.fd)
+                            proc.stdin.close()
+                        continue
+                    try:
+                        chunk = os.read(key.fd, READ_SIZE)
+                    except BlockingIOError:
+                        continue
+                    if chunk:
+                        # Hold back a trailing partial line until the rest arrives
+                        data, _, pending[key.fd] = (pending[key.fd] + chunk).rpartition(b"\n")
+                    else:
+                        selector.unregister(key.fd)
+                        data, pending[key.fd] = pending[key.fd], b""
+                    if data:
+                        self.emit_lines(data, key.data)
+                self.flush_lines()
+            selector.close()
+            self.flush_lines(force=True)
+
+            if self._cancel:
+                self.cancel()
+            rc = proc.wait()
+            self.signals.done_signal.emit(rc, self.captured_lines)
+
+        except FileNotFoundError:
+            # A missing GAM is reported by Popen itself rather than checked
+            # with a stat before every launch
+            err_line = f"\n[Error] Could not find 'gam' at {self.cmd_list[0]}"
+            self.signals.line_signal.emit(err_line)
+            self.captured_lines.append(err_line)
+            self.signals.done_signal.emit(1, self.captured_lines)
+        except Exception as e:
+            ex_line = f"[Exception] {str(e)}"
+            # Output read before the failure goes out with the error, in one signal
+            self._batch.append(ex_line)
+            self.flush_lines(force=True)
+            self.captured_lines.append(ex_line)
+            self.signals.done_signal.emit(1, self.captured_lines)